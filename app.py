@@ -1,9 +1,13 @@
+import hashlib
 import os
-import json
+import time
+from functools import lru_cache
+
+import orjson
 import uvicorn
 
-from fastapi import FastAPI, Request
-from fastapi.responses import HTMLResponse
+from fastapi import FastAPI, Request, Response
+from fastapi.responses import HTMLResponse, ORJSONResponse
 from fastapi.staticfiles import StaticFiles
 from sqlmodel import select
 from jinja2 import Environment, FileSystemLoader, select_autoescape
@@ -11,52 +15,100 @@ from jinja2 import Environment, FileSystemLoader, select_autoescape
 from config import settings, THEMES
 from database import get_session, create_db_and_tables
 from models import Movement, Event, MovementEventLink, ThemeSnapshot, TextSnapshot
-from engine.themes import aggregate_themes
+from engine.api_frontier import get_frontier_theme_briefs_json
+from engine.themes import MovementRow, aggregate_themes
 
 BASE_DIR = os.path.dirname(os.path.abspath(__file__))
 
 templates = Environment(
     loader=FileSystemLoader(os.path.join(BASE_DIR, "ui", "templates")),
     autoescape=select_autoescape(["html", "xml"]),
+    auto_reload=False,  # templates don't change at runtime; skip mtime checks
+    cache_size=400,
 )
 
-app = FastAPI(title=settings.app_name)
+
+@lru_cache(maxsize=64)
+def _get_template(template_name: str):
+    return templates.get_template(template_name)
+
+
+# Compile every page template at import time so the first request
+# doesn't pay the cold-compile penalty.
+for _name in ("dashboard.html", "theme.html", "movement.html", "history.html", "frontier.html"):
+    _get_template(_name)
+
+app = FastAPI(title=settings.app_name, default_response_class=ORJSONResponse)
 app.mount("/static", StaticFiles(directory=os.path.join(BASE_DIR, "ui", "static")), name="static")
 
 
 def render(template_name: str, **ctx):
-    tpl = templates.get_template(template_name)
-    return HTMLResponse(tpl.render(**ctx))
+    return HTMLResponse(_get_template(template_name).render(**ctx))
+
+
+# Dashboard/history only change when build/snapshot runs (nightly/quarterly),
+# so repeat hits within the TTL skip SQL + render entirely.
+_PAGE_CACHE: dict = {}  # key -> (expires_monotonic, etag, body)
+_PAGE_TTL_S = 60.0
+
+
+def _cached_page(request: Request, key: str, build_body):
+    hit = _PAGE_CACHE.get(key)
+    if not hit or time.monotonic() >= hit[0]:
+        body = build_body()
+        etag = '"' + hashlib.sha256(body.encode("utf-8")).hexdigest()[:32] + '"'
+        hit = (time.monotonic() + _PAGE_TTL_S, etag, body)
+        _PAGE_CACHE[key] = hit
+
+    _, etag, body = hit
+    headers = {"ETag": etag, "Cache-Control": "public, max-age=60"}
+    if request.headers.get("if-none-match") == etag:
+        return Response(status_code=304, headers=headers)
+    return HTMLResponse(body, headers=headers)
 
 
 @app.on_event("startup")
 def startup():
     create_db_and_tables()
 
+    # The DB-bound handlers stay sync and run on anyio's worker threads;
+    # the default 40 tokens throttles concurrency under load.
+    import anyio.to_thread
+
+    anyio.to_thread.current_default_thread_limiter().total_tokens = 128
+
 
 @app.get("/health")
-def health():
+async def health():
     return {"status": "ok", "app": settings.app_name}
 
 
 @app.get("/", response_class=HTMLResponse)
 def dashboard(request: Request):
+    return _cached_page(request, "dashboard", _dashboard_body)
+
+
+def _dashboard_body() -> str:
     with get_session() as session:
-        movements = session.exec(select(Movement)).all()
-        m_dicts = [
-            {
-                "id": m.id,
-                "theme": m.theme,
-                "stabilized_impact": m.stabilized_impact,
-                "confidence_score": m.confidence_score,
-                "confidence_label": m.confidence_label,
-                "acceleration_arrow": m.acceleration_arrow,
-            }
-            for m in movements
-        ]
-        themes = aggregate_themes(m_dicts) if m_dicts else []
-
-        text = session.exec(select(TextSnapshot).order_by(TextSnapshot.created_at.desc())).first()
+        # Only the columns aggregate_themes needs — skips full ORM hydration,
+        # and lets SQLite hand back rows already grouped/ranked per theme.
+        rows = session.exec(
+            select(
+                Movement.id,
+                Movement.theme,
+                Movement.stabilized_impact,
+                Movement.confidence_score,
+                Movement.confidence_label,
+                Movement.acceleration_arrow,
+            ).order_by(Movement.theme, Movement.stabilized_impact.desc())
+        ).all()
+        m_rows = [MovementRow._make(r) for r in rows]
+        themes = aggregate_themes(m_rows, presorted=True) if m_rows else []
+
+        # LIMIT 1 lets SQLite do a top-1 index walk instead of a full sort
+        text = session.exec(
+            select(TextSnapshot).order_by(TextSnapshot.created_at.desc()).limit(1)
+        ).first()
 
     top5 = themes[:5]
     bubble_data = [
@@ -72,13 +124,11 @@ def dashboard(request: Request):
     executive_summary = text.executive_summary if text else "No snapshot yet. Run: python cli.py snapshot"
     discussion_topics = text.discussion_topics if text else ""
 
-    return render(
-        "dashboard.html",
-        request=request,
+    return _get_template("dashboard.html").render(
         app_name=settings.app_name,
         themes=themes,
         top5=top5,
-        bubble_data_json=json.dumps(bubble_data),
+        bubble_data_json=orjson.dumps(bubble_data).decode(),
         executive_summary=executive_summary,
         discussion_topics=discussion_topics,
     )
@@ -87,8 +137,17 @@ def dashboard(request: Request):
 @app.get("/theme/{theme_name}", response_class=HTMLResponse)
 def theme_detail(request: Request, theme_name: str):
     with get_session() as session:
+        # Only the table columns the template renders — in particular this
+        # never drags the audit_json blob along per row
         movements = session.exec(
-            select(Movement)
+            select(
+                Movement.id,
+                Movement.name,
+                Movement.impact_score,
+                Movement.stabilized_impact,
+                Movement.acceleration_arrow,
+                Movement.confidence_label,
+            )
             .where(Movement.theme == theme_name)
             .order_by(Movement.stabilized_impact.desc())
         ).all()
@@ -106,15 +165,14 @@ def theme_detail(request: Request, theme_name: str):
 def movement_detail(request: Request, movement_id: int):
     with get_session() as session:
         m = session.get(Movement, movement_id)
-        links = session.exec(select(MovementEventLink).where(MovementEventLink.movement_id == movement_id)).all()
-        ev_ids = [l.event_id for l in links]
-        events = session.exec(select(Event).where(Event.id.in_(ev_ids)).order_by(Event.date.desc())).all()
+        events = session.exec(
+            select(Event)
+            .join(MovementEventLink, MovementEventLink.event_id == Event.id)
+            .where(MovementEventLink.movement_id == movement_id)
+            .order_by(Event.date.desc())
+        ).all()
 
-    audit = {}
-    try:
-        audit = json.loads(m.audit_json or "{}") if m else {}
-    except Exception:
-        audit = {}
+    audit = (m.audit_json or {}) if m else {}
 
     return render(
         "movement.html",
@@ -128,31 +186,35 @@ def movement_detail(request: Request, movement_id: int):
 
 @app.get("/history", response_class=HTMLResponse)
 def history(request: Request):
+    return _cached_page(request, "history", _history_body)
+
+
+def _history_body() -> str:
     with get_session() as session:
-        theme_snaps = session.exec(select(ThemeSnapshot).order_by(ThemeSnapshot.created_at)).all()
+        # Three columns are all the series needs — skip ORM hydration.
+        # created_at order kept so the latest snapshot wins per (theme, quarter).
+        theme_snaps = session.exec(
+            select(ThemeSnapshot.theme, ThemeSnapshot.quarter_id, ThemeSnapshot.theme_score)
+            .order_by(ThemeSnapshot.created_at)
+        ).all()
 
     quarters = sorted({s.quarter_id for s in theme_snaps})
-    series = {}
-    for t in THEMES:
-        pts = []
-        for q in quarters:
-            match = next((s for s in theme_snaps if s.theme == t and s.quarter_id == q), None)
-            pts.append(match.theme_score if match else 0)
-        series[t] = pts
+    # (theme, quarter) -> score index: one O(S) pass instead of scanning
+    # all snapshots for every theme x quarter cell
+    idx = {(s.theme, s.quarter_id): s.theme_score for s in theme_snaps}
+    series = {t: [idx.get((t, q), 0) for q in quarters] for t in THEMES}
 
-    return render(
-        "history.html",
-        request=request,
+    return _get_template("history.html").render(
         app_name=settings.app_name,
         quarters=quarters,
-        series_json=json.dumps(series),
+        series_json=orjson.dumps(series).decode(),
         themes=THEMES,
     )
 
 
 
 @app.get("/frontier", response_class=HTMLResponse)
-def frontier_page(request: Request):
+async def frontier_page(request: Request):
     return render(
         "frontier.html",
         request=request,
@@ -167,6 +229,7 @@ def frontier_themes(top_n: int = 6, events_per_theme: int = 5):
     """
     Frontier Theme Briefs (board-grade)
     """
-    from engine.api_frontier import get_frontier_theme_briefs
-    return get_frontier_theme_briefs(top_n=top_n, events_per_theme=events_per_theme)
+    # Pre-encoded by the cache layer — send the bytes straight through
+    payload = get_frontier_theme_briefs_json(top_n=top_n, events_per_theme=events_per_theme)
+    return Response(content=payload, media_type="application/json")
 
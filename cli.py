@@ -1,7 +1,7 @@
 import argparse
-import json
 from datetime import datetime
 
+
 from sqlmodel import select
 
 
@@ -66,19 +66,6 @@ def register_default_connectors():
         )
     )
 
-def movement_history_impacts(movement_id: int):
-    from database import get_session
-    from models import MovementSnapshot
-
-    with get_session() as session:
-        snaps = session.exec(
-            select(MovementSnapshot)
-            .where(MovementSnapshot.movement_id == movement_id)
-            .order_by(MovementSnapshot.created_at)
-        ).all()
-        return [s.impact_score for s in snaps]
-
-
 def build(days: int = 365, cluster_threshold: float = 0.55):
     from database import get_session
     from engine.baseline import baseline_counts_90d_for_movement
@@ -88,31 +75,50 @@ def build(days: int = 365, cluster_threshold: float = 0.55):
         compute_acceleration,
         compute_component_scores,
         compute_confidence,
-        compute_impact,
+        compute_impact_batch,
         stabilize_with_persistence,
     )
     from engine.summary import generate_discussion_topics, generate_executive_summary
-    from engine.themes import aggregate_themes
-    from models import Event, Movement
+    from engine.themes import MovementRow, aggregate_themes
+    from models import Event, Movement, MovementEventLink, MovementSnapshot
 
     # 1) cluster events -> movements (creates/updates Movement + MovementEventLink)
     n = build_movements(days=days, distance_threshold=cluster_threshold)
 
     # 2) compute scoring per movement
     with get_session() as session:
-        movements = session.exec(select(Movement)).all()
-
-        for m in movements:
-            # If you later wire ORM relationship, you can replace this with m.events
-            # For now, pull events via join on MovementEventLink
-            from models import MovementEventLink
-
-            links = session.exec(select(MovementEventLink).where(MovementEventLink.movement_id == m.id)).all()
-            ev_ids = [l.event_id for l in links if l.event_id is not None]
-            if not ev_ids:
-                continue
+        movement_ids = session.exec(select(Movement.id)).all()
+
+        # One joined, column-projected fetch for all movements instead of
+        # hydrating Movement/Event ORM objects per movement
+        link_rows = session.exec(
+            select(
+                MovementEventLink.movement_id,
+                Event.signal_type,
+                Event.source_tier,
+                Event.date,
+                Event.url,
+                Event.source_name,
+            ).join(Event, Event.id == MovementEventLink.event_id)
+        ).all()
+        events_by_movement = {}
+        for row in link_rows:
+            events_by_movement.setdefault(row.movement_id, []).append(row)
+
+        # Snapshot history for all movements in one query (was a session +
+        # SELECT per movement)
+        snap_rows = session.exec(
+            select(MovementSnapshot.movement_id, MovementSnapshot.impact_score)
+            .where(MovementSnapshot.movement_id.in_(movement_ids))
+            .order_by(MovementSnapshot.movement_id, MovementSnapshot.created_at)
+        ).all()
+        history_by_movement = {}
+        for movement_id, impact_score in snap_rows:
+            history_by_movement.setdefault(movement_id, []).append(impact_score)
 
-            evs = session.exec(select(Event).where(Event.id.in_(ev_ids))).all()
+        pending = []
+        for mid in movement_ids:
+            evs = events_by_movement.get(mid)
             if not evs:
                 continue
 
@@ -125,16 +131,23 @@ def build(days: int = 365, cluster_threshold: float = 0.55):
                 }
                 for e in evs
             ]
+            pending.append((mid, evs, ev_dicts, compute_component_scores(ev_dicts)))
+
+        # One matmul scores every movement's impact at once instead of a
+        # scalar weighted sum per movement
+        impacts = compute_impact_batch([comp for _, _, _, comp in pending])
 
-            components = compute_component_scores(ev_dicts)
-            impact = compute_impact(components)
+        build_now = datetime.utcnow()
+        updates = []
+        for (mid, evs, ev_dicts, components), impact in zip(pending, impacts):
+            impact = float(impact)
             conf_score, conf_label, conf_meta = compute_confidence(ev_dicts, components)
 
             # ✅ Correct baseline: historical window excluding last 90 days
-            baseline90 = baseline_counts_90d_for_movement(session, m.id)
-            accel_raw, arrow, accel_meta = compute_acceleration(ev_dicts, baseline90)
+            baseline90 = baseline_counts_90d_for_movement(session, mid)
+            accel_raw, arrow, accel_meta = compute_acceleration(ev_dicts, baseline90, now=build_now)
 
-            history = movement_history_impacts(m.id)
+            history = history_by_movement.get(mid, [])
             if history:
                 hits = sum(1 for x in history[-4:] if x >= 50.0)
                 persistence = hits / 4.0
@@ -143,50 +156,50 @@ def build(days: int = 365, cluster_threshold: float = 0.55):
 
             stabilized = stabilize_with_persistence(impact, persistence)
 
-            m.research_momentum = components["research_momentum"]
-            m.capital_momentum = components["capital_momentum"]
-            m.reg_momentum = components["reg_momentum"]
-            m.infra_deploy = components["infra_deploy"]
-            m.cross_adoption = components["cross_adoption"]
-            m.impact_score = impact
-            m.stabilized_impact = stabilized
-            m.confidence_score = conf_score
-            m.confidence_label = conf_label
-            m.accel_raw = accel_raw
-            m.acceleration_arrow = arrow
-            m.persistence = round(persistence, 3)
-            m.updated_at = datetime.utcnow()
-
             audit = audit_payload(components, impact, conf_meta, accel_meta)
             audit["movement_event_count"] = len(evs)
-            # source_name might not be present on Event; guard it
-            audit["tier1_sources"] = len({getattr(e, "source_name", None) for e in evs if e.source_tier == 1})
-            m.audit_json = json.dumps(audit)
+            audit["tier1_sources"] = len({e.source_name for e in evs if e.source_tier == 1})
 
-            session.add(m)
+            updates.append(
+                {
+                    "id": mid,
+                    "research_momentum": components["research_momentum"],
+                    "capital_momentum": components["capital_momentum"],
+                    "reg_momentum": components["reg_momentum"],
+                    "infra_deploy": components["infra_deploy"],
+                    "cross_adoption": components["cross_adoption"],
+                    "impact_score": impact,
+                    "stabilized_impact": stabilized,
+                    "confidence_score": conf_score,
+                    "confidence_label": conf_label,
+                    "accel_raw": accel_raw,
+                    "acceleration_arrow": arrow,
+                    "persistence": round(persistence, 3),
+                    "updated_at": datetime.utcnow(),
+                    "audit_json": audit,
+                }
+            )
 
+        if updates:
+            session.bulk_update_mappings(Movement, updates)
         session.commit()
 
-    # 3) themes + summaries
-    from database import get_session
+        # 3) themes + summaries — same session, committed values, projected columns
+        rows = session.exec(
+            select(
+                Movement.id,
+                Movement.theme,
+                Movement.stabilized_impact,
+                Movement.confidence_score,
+                Movement.confidence_label,
+                Movement.acceleration_arrow,
+            ).order_by(Movement.theme, Movement.stabilized_impact.desc())
+        ).all()
+        m_rows = [MovementRow._make(r) for r in rows]
 
-    with get_session() as session:
-        movements = session.exec(select(Movement)).all()
-        m_dicts = [
-            {
-                "id": m.id,
-                "theme": m.theme,
-                "stabilized_impact": m.stabilized_impact,
-                "confidence_score": m.confidence_score,
-                "confidence_label": m.confidence_label,
-                "acceleration_arrow": m.acceleration_arrow,
-            }
-            for m in movements
-        ]
-
-    themes = aggregate_themes(m_dicts)
-    exec_sum = generate_executive_summary(themes, m_dicts)
-    discuss = generate_discussion_topics(themes, m_dicts)
+    themes = aggregate_themes(m_rows, presorted=True)
+    exec_sum = generate_executive_summary(themes, m_rows)
+    discuss = generate_discussion_topics(themes, m_rows)
 
     return {
         "movements_built": n,
@@ -200,26 +213,27 @@ def snapshot():
     from database import get_session
     from engine.snapshot import create_snapshot
     from engine.summary import generate_discussion_topics, generate_executive_summary
-    from engine.themes import aggregate_themes
+    from engine.themes import MovementRow, aggregate_themes
     from models import Movement
 
     with get_session() as session:
-        movements = session.exec(select(Movement)).all()
-        m_dicts = [
-            {
-                "id": m.id,
-                "theme": m.theme,
-                "stabilized_impact": m.stabilized_impact,
-                "confidence_score": m.confidence_score,
-                "confidence_label": m.confidence_label,
-                "acceleration_arrow": m.acceleration_arrow,
-            }
-            for m in movements
-        ]
-
-    themes = aggregate_themes(m_dicts)
-    exec_sum = generate_executive_summary(themes, m_dicts)
-    discuss = generate_discussion_topics(themes, m_dicts)
+        # Narrow projection in index order — aggregate_themes consumes the
+        # rows in one pass, no ORM hydration, no Python-side sort
+        rows = session.exec(
+            select(
+                Movement.id,
+                Movement.theme,
+                Movement.stabilized_impact,
+                Movement.confidence_score,
+                Movement.confidence_label,
+                Movement.acceleration_arrow,
+            ).order_by(Movement.theme, Movement.stabilized_impact.desc())
+        ).all()
+        m_rows = [MovementRow._make(r) for r in rows]
+
+    themes = aggregate_themes(m_rows, presorted=True)
+    exec_sum = generate_executive_summary(themes, m_rows)
+    discuss = generate_discussion_topics(themes, m_rows)
 
     qid = create_snapshot(themes, exec_sum, discuss)
     return qid
@@ -1,17 +1,56 @@
 from __future__ import annotations
 
-from datetime import datetime, timedelta
-from typing import Dict, List
+import time
+from datetime import datetime, timedelta, timezone
+from typing import Dict, List, Optional
 from urllib.parse import quote_plus
+from xml.etree import ElementTree
 
-import feedparser
+import httpx
+
+ATOM_NS = "{http://www.w3.org/2005/Atom}"
+
+# Shared client: reuses the TCP connection across calls to the arXiv API
+_CLIENT = httpx.Client(timeout=25, follow_redirects=True)
+
+
+def _parse_published(s: Optional[str]) -> Optional[datetime]:
+    # arXiv Atom timestamps look like "2024-01-31T18:00:00Z"
+    if not s:
+        return None
+    try:
+        dt = datetime.fromisoformat(s.replace("Z", "+00:00"))
+    except ValueError:
+        return None
+    if dt.tzinfo is not None:
+        dt = dt.astimezone(timezone.utc).replace(tzinfo=None)
+    return dt
+
+
+def _get_with_backoff(url: str, retries: int = 3, base_sleep_s: float = 3.0) -> httpx.Response:
+    """
+    The arXiv API throttles aggressively; retry transient failures with
+    exponential backoff. Connectors run on CLI/worker threads (never on the
+    uvicorn event loop), so a plain sleep here stalls nothing else.
+    """
+    last_exc: Exception | None = None
+    for attempt in range(retries):
+        try:
+            r = _CLIENT.get(url)
+            r.raise_for_status()
+            return r
+        except httpx.HTTPError as e:
+            last_exc = e
+            if attempt < retries - 1:
+                time.sleep(base_sleep_s * (2 ** attempt))
+    raise last_exc  # type: ignore[misc]
 
 
 def fetch_arxiv(query: str, days: int = 365, max_results: int = 80) -> List[Dict]:
     """
     Minimal arXiv fetcher that returns a list of event dicts:
     {title, url, date, source_name}
-    Uses arXiv API (Atom).
+    Uses arXiv API (Atom), parsed with ElementTree (much lighter than feedparser).
     """
 
     # ✅ FIX: URL-encode query to avoid InvalidURL errors
@@ -24,24 +63,30 @@ def fetch_arxiv(query: str, days: int = 365, max_results: int = 80) -> List[Dict
         f"&max_results={max_results}"
     )
 
-    feed = feedparser.parse(url)
+    r = _get_with_backoff(url)
+    root = ElementTree.fromstring(r.content)
 
     cutoff = datetime.utcnow() - timedelta(days=days)
     events: List[Dict] = []
 
-    for entry in getattr(feed, "entries", []):
-        published = None
-
-        if getattr(entry, "published_parsed", None):
-            published = datetime(*entry.published_parsed[:6])
-
+    for entry in root.iter(f"{ATOM_NS}entry"):
+        published = _parse_published(entry.findtext(f"{ATOM_NS}published"))
         if not published or published < cutoff:
             continue
 
+        link = None
+        for ln in entry.iter(f"{ATOM_NS}link"):
+            href = ln.get("href")
+            if href and ln.get("rel", "alternate") == "alternate":
+                link = href
+                break
+        if not link:
+            link = entry.findtext(f"{ATOM_NS}id")
+
         events.append(
             {
-                "title": getattr(entry, "title", "").strip(),
-                "url": getattr(entry, "link", None),
+                "title": (entry.findtext(f"{ATOM_NS}title") or "").strip(),
+                "url": link,
                 "date": published,
                 "source_name": "arXiv",
             }
@@ -1,5 +1,22 @@
+import inspect
 from dataclasses import dataclass
-from typing import Any, Callable, Dict, List
+from typing import Any, Callable, Dict, List, Optional
+
+
+def _fetch_is_days_only(fetch: Callable) -> bool:
+    """True if fetch can be called as fetch(days=...) with no other required args."""
+    try:
+        sig = inspect.signature(fetch)
+    except Exception:
+        return True
+
+    for p in sig.parameters.values():
+        if p.kind in (p.POSITIONAL_ONLY, p.POSITIONAL_OR_KEYWORD):
+            if p.name == "days":
+                continue
+            if p.default is inspect._empty:
+                return False
+    return True
 
 
 @dataclass
@@ -9,6 +26,13 @@ class ConnectorSpec:
     source_tier: int
     signal_type: str
     fetch: Callable[..., List[Dict[str, Any]]]
+    # resolved once at registration — inspect.signature is too slow to rerun
+    # per ingest pass
+    fetch_days_only: Optional[bool] = None
+
+    def __post_init__(self):
+        if self.fetch_days_only is None:
+            self.fetch_days_only = _fetch_is_days_only(self.fetch) if callable(self.fetch) else False
 
 
 CONNECTORS: List[ConnectorSpec] = []
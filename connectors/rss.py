@@ -1,35 +1,86 @@
 from __future__ import annotations
 
+import json
+import os
+import threading
 from datetime import datetime, timedelta, timezone
 from typing import Dict, List, Optional
 
+from email.utils import parsedate_to_datetime
+
 import feedparser
-import requests
+import httpx
+from lxml import etree
+
+HEADERS = {
+    "User-Agent": "Mozilla/5.0 (FrontierRadar/1.0; +https://github.com/Losfamilos/Frontier)",
+    "Accept": "application/rss+xml, application/atom+xml, application/xml;q=0.9, text/xml;q=0.8, */*;q=0.7",
+}
+
+# Shared client: pools connections so repeat fetches against the same host
+# (ECB/BIS press feeds etc.) skip the TCP/TLS handshake
+_CLIENT = httpx.Client(
+    timeout=httpx.Timeout(25, connect=5.0),
+    follow_redirects=True,
+    headers=HEADERS,
+)
+
+# Conditional-GET state (ETag / Last-Modified per feed URL) so unchanged
+# feeds answer 304 and we skip both the download and the parse
+_STATE_PATH = os.path.join(".cache", "rss_feed_state.json")
+_STATE_LOCK = threading.Lock()
+
+
+def _load_feed_state() -> Dict[str, Dict[str, str]]:
+    try:
+        with open(_STATE_PATH, encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+def _store_feed_state(feed_url: str, etag: Optional[str], last_modified: Optional[str]) -> None:
+    if not etag and not last_modified:
+        return
+    with _STATE_LOCK:
+        state = _load_feed_state()
+        state[feed_url] = {"etag": etag or "", "last_modified": last_modified or ""}
+        try:
+            os.makedirs(os.path.dirname(_STATE_PATH), exist_ok=True)
+            with open(_STATE_PATH, "w", encoding="utf-8") as f:
+                json.dump(state, f)
+        except OSError:
+            pass  # cache is best-effort; never fail a fetch over it
+
+
+def _conditional_headers(feed_url: str) -> Dict[str, str]:
+    known = _load_feed_state().get(feed_url) or {}
+    headers: Dict[str, str] = {}
+    if known.get("etag"):
+        headers["If-None-Match"] = known["etag"]
+    if known.get("last_modified"):
+        headers["If-Modified-Since"] = known["last_modified"]
+    return headers
 
 
 def _to_datetime(entry) -> Optional[datetime]:
-    # feedparser gives *_parsed as time.struct_time
+    # Parse the raw string fields directly (RFC 822 pubDate or ISO Atom
+    # dates) — one aware datetime per entry, no struct_time round-trip
+    for key in ("published", "updated", "created"):
+        s = getattr(entry, key, None)
+        if isinstance(s, str) and s.strip():
+            dt = _parse_entry_date(s)
+            if dt:
+                return dt
+
+    # last resort: feedparser's pre-chewed struct_time
     for key in ("published_parsed", "updated_parsed", "created_parsed"):
         t = getattr(entry, key, None)
         if t:
             try:
-                dt = datetime(*t[:6])
-                # treat naive as UTC
-                return dt.replace(tzinfo=timezone.utc)
+                return datetime(*t[:6], tzinfo=timezone.utc)
             except Exception:
                 pass
-
-    # fallback: try string fields (best-effort)
-    for key in ("published", "updated", "created"):
-        s = getattr(entry, key, None)
-        if isinstance(s, str) and s.strip():
-            try:
-                dt = datetime.fromisoformat(s.replace("Z", "+00:00"))
-                if dt.tzinfo is None:
-                    dt = dt.replace(tzinfo=timezone.utc)
-                return dt
-            except Exception:
-                return None
     return None
 
 
@@ -38,15 +89,122 @@ def fetch_rss(feed_url: str, days: int = 365, max_items: int = 200) -> List[Dict
     Robust RSS/Atom fetcher.
     Returns list of dicts: {title, summary, url, date}
     """
-    headers = {
-        "User-Agent": "Mozilla/5.0 (FrontierRadar/1.0; +https://github.com/Losfamilos/Frontier)",
-        "Accept": "application/rss+xml, application/atom+xml, application/xml;q=0.9, text/xml;q=0.8, */*;q=0.7",
-    }
-
-    r = requests.get(feed_url, headers=headers, timeout=25, allow_redirects=True)
+    r = _CLIENT.get(feed_url, headers=_conditional_headers(feed_url))
+    if r.status_code == 304:
+        # Feed unchanged since last run — nothing new to parse
+        return []
     r.raise_for_status()
+    _store_feed_state(feed_url, r.headers.get("ETag"), r.headers.get("Last-Modified"))
+
+    return _parse_feed(r.text, days=days, max_items=max_items)
+
+
+async def fetch_rss_many(feed_urls: List[str], days: int = 365, max_items: int = 200) -> Dict[str, object]:
+    """
+    Fetch many feeds concurrently over one AsyncClient — wall time is the
+    slowest feed instead of the sum. Returns {feed_url: items or Exception};
+    callers decide how to report failures.
+    """
+    import asyncio
+
+    async with httpx.AsyncClient(
+        timeout=httpx.Timeout(25, connect=5.0),
+        follow_redirects=True,
+        headers=HEADERS,
+        limits=httpx.Limits(max_connections=32),
+    ) as client:
+
+        async def _one(url: str) -> str:
+            r = await client.get(url)
+            r.raise_for_status()
+            return r.text
+
+        bodies = await asyncio.gather(*[_one(u) for u in feed_urls], return_exceptions=True)
+
+    out: Dict[str, object] = {}
+    for url, body in zip(feed_urls, bodies):
+        if isinstance(body, Exception):
+            out[url] = body
+        else:
+            out[url] = _parse_feed(body, days=days, max_items=max_items)
+    return out
+
+
+def _localname(tag) -> str:
+    # "{http://www.w3.org/2005/Atom}entry" -> "entry"
+    return tag.rsplit("}", 1)[-1] if isinstance(tag, str) else ""
+
+
+def _parse_entry_date(raw: Optional[str]) -> Optional[datetime]:
+    if not raw or not raw.strip():
+        return None
+    raw = raw.strip()
+    try:
+        dt = parsedate_to_datetime(raw)  # RFC 822 (RSS pubDate)
+    except (TypeError, ValueError):
+        try:
+            dt = datetime.fromisoformat(raw.replace("Z", "+00:00"))  # Atom
+        except ValueError:
+            return None
+    if dt.tzinfo is None:
+        dt = dt.replace(tzinfo=timezone.utc)
+    return dt
+
+
+def _parse_feed_lxml(text: str, days: int, max_items: int) -> List[Dict]:
+    root = etree.fromstring(
+        text.encode("utf-8"),
+        parser=etree.XMLParser(recover=True, resolve_entities=False),
+    )
+    if root is None:
+        raise ValueError("unparseable feed")
+
+    cutoff = datetime.now(timezone.utc) - timedelta(days=days)
+    out: List[Dict] = []
+
+    entries = [el for el in root.iter() if _localname(el.tag) in ("item", "entry")]
+    for el in entries[:max_items]:
+        title = link = summary = date_raw = None
+        for child in el:
+            name = _localname(child.tag)
+            if name == "title":
+                title = child.text
+            elif name == "link" and not link:
+                # RSS puts the URL in text; Atom in href (prefer rel=alternate)
+                if child.text and child.text.strip():
+                    link = child.text.strip()
+                elif child.get("href") and child.get("rel", "alternate") == "alternate":
+                    link = child.get("href")
+            elif name in ("description", "summary") and not summary:
+                summary = child.text
+            elif name in ("pubDate", "published", "updated", "date") and not date_raw:
+                date_raw = child.text
+
+        dt = _parse_entry_date(date_raw)
+        if not dt or dt < cutoff:
+            continue
+
+        out.append(
+            {
+                "title": (title or "").strip(),
+                "summary": (summary or "").strip(),
+                "url": link,
+                "date": dt,
+            }
+        )
+
+    return out
+
+
+def _parse_feed(text: str, days: int = 365, max_items: int = 200) -> List[Dict]:
+    # lxml fast path; feedparser stays as the fallback for feeds too
+    # malformed even for the recovering parser
+    try:
+        return _parse_feed_lxml(text, days=days, max_items=max_items)
+    except Exception:
+        pass
 
-    feed = feedparser.parse(r.text)
+    feed = feedparser.parse(text)
 
     cutoff = datetime.now(timezone.utc) - timedelta(days=days)
     out: List[Dict] = []
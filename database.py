@@ -1,12 +1,162 @@
+import hashlib
+
+import orjson
+from sqlalchemy import event
 from sqlmodel import SQLModel, Session, create_engine
 
 from config import settings
 
-engine = create_engine(settings.db_url, echo=False)
+_is_sqlite = settings.db_url.startswith("sqlite")
+
+# check_same_thread=False lets SQLAlchemy's pool hand pooled connections to
+# uvicorn worker threads instead of opening a fresh one per request
+connect_args = {"check_same_thread": False} if _is_sqlite else {}
+
+# orjson on the JSON columns (Movement.audit_json, ThemeSnapshot.
+# top_movement_ids) instead of stdlib json
+engine = create_engine(
+    settings.db_url,
+    echo=False,
+    connect_args=connect_args,
+    json_serializer=lambda obj: orjson.dumps(obj).decode(),
+    json_deserializer=orjson.loads,
+)
+
+# ON CONFLICT inserts are dialect-specific constructs; export the variant
+# matching the configured backend so the engine modules stay portable.
+# SQLite and Postgres share the on_conflict_* API, which covers every
+# backend db_url is deployed against.
+if _is_sqlite:
+    from sqlalchemy.dialects.sqlite import insert as upsert
+else:
+    from sqlalchemy.dialects.postgresql import insert as upsert
+
+if _is_sqlite:
+
+    @event.listens_for(engine, "connect")
+    def _set_sqlite_pragmas(dbapi_connection, connection_record):
+        # WAL lets readers run concurrently with the nightly build's writes;
+        # synchronous=NORMAL drops the per-commit fsync (safe under WAL)
+        cursor = dbapi_connection.cursor()
+        cursor.execute("PRAGMA journal_mode=WAL")
+        cursor.execute("PRAGMA synchronous=NORMAL")
+        cursor.execute("PRAGMA temp_store=MEMORY")
+        cursor.execute("PRAGMA cache_size=-64000")
+        cursor.execute("PRAGMA mmap_size=268435456")
+        cursor.close()
 
 
 def create_db_and_tables():
+    # create_all only sees tables registered on SQLModel.metadata; import the
+    # models here so entry points that don't otherwise touch them (cli.py
+    # init-db) still create the schema instead of crashing in the migrations
+    import models  # registers Event/Movement/snapshot tables on the metadata
+
     SQLModel.metadata.create_all(engine)
+    _migrate_haystack_lc()
+    _migrate_event_uids()
+    _migrate_top_movement_ids()
+    _migrate_movement_index()
+    _migrate_missing_indexes()
+
+
+def _migrate_haystack_lc():
+    # create_all never alters existing tables; backfill the materialized
+    # haystack column on DBs created before it existed (v1 migration)
+    if not _is_sqlite:
+        return
+    with engine.connect() as conn:
+        cols = {row[1] for row in conn.exec_driver_sql("PRAGMA table_info(event)")}
+        if "haystack_lc" not in cols:
+            conn.exec_driver_sql("ALTER TABLE event ADD COLUMN haystack_lc VARCHAR")
+        conn.exec_driver_sql(
+            "UPDATE event SET haystack_lc = lower(title || ' ' || summary) WHERE haystack_lc IS NULL"
+        )
+        conn.commit()
+
+
+def _migrate_event_uids():
+    # event uids moved from SHA-1 to blake2b; rows keyed under the old hash
+    # would no longer collide with re-fetched items, so ON CONFLICT DO
+    # NOTHING would duplicate up to a fetch window of events. Re-key exactly
+    # the rows whose uid is the SHA-1 of their own stored fields —
+    # connector-supplied uids don't match either hash and pass through
+    if not _is_sqlite:
+        return
+    with engine.connect() as conn:
+        rows = conn.exec_driver_sql(
+            "SELECT id, event_uid, source_name, url, title, date FROM event"
+        ).fetchall()
+        updates = []
+        for rid, uid, source_name, url, title, date in rows:
+            # same base string as engine.ingest._stable_event_uid; stored
+            # dates are naive UTC text, so the date part is the first 10 chars
+            base = "|".join(
+                [
+                    (source_name or "").strip().lower(),
+                    (url or "").strip(),
+                    (title or "").strip().lower(),
+                    (date or "")[:10],
+                ]
+            ).encode("utf-8")
+            if hashlib.sha1(base).hexdigest() == uid:
+                updates.append((hashlib.blake2b(base, digest_size=20).hexdigest(), rid))
+        if updates:
+            # OR IGNORE: if a duplicate already landed under the blake2b key,
+            # keep the old-keyed row rather than fail the whole migration
+            conn.exec_driver_sql("UPDATE OR IGNORE event SET event_uid = ? WHERE id = ?", updates)
+            conn.commit()
+
+
+def _migrate_top_movement_ids():
+    # v1 stored top_movement_ids as "1,2,3"; wrap legacy rows in brackets so
+    # they parse as JSON arrays (audit_json was always valid JSON text)
+    if not _is_sqlite:
+        return
+    with engine.connect() as conn:
+        conn.exec_driver_sql(
+            "UPDATE themesnapshot SET top_movement_ids = '[' || top_movement_ids || ']' "
+            "WHERE top_movement_ids NOT LIKE '[%'"
+        )
+        conn.commit()
+
+
+def _migrate_movement_index():
+    # ix_movement_theme_impact was originally (theme, stabilized_impact ASC);
+    # drop that definition so _migrate_missing_indexes recreates it with the
+    # descending covering one
+    if not _is_sqlite:
+        return
+    with engine.connect() as conn:
+        row = conn.exec_driver_sql(
+            "SELECT sql FROM sqlite_master WHERE type='index' AND name='ix_movement_theme_impact'"
+        ).fetchone()
+        if row and row[0] and "DESC" not in row[0]:
+            conn.exec_driver_sql("DROP INDEX ix_movement_theme_impact")
+            conn.commit()
+
+
+def _migrate_missing_indexes():
+    # create_all(checkfirst) skips indexes entirely when the table already
+    # exists, so DBs created before these composite indexes were added to the
+    # models never get them; create them here with IF NOT EXISTS
+    if not _is_sqlite:
+        return
+    with engine.connect() as conn:
+        conn.exec_driver_sql(
+            "CREATE INDEX IF NOT EXISTS ix_movement_theme_impact ON movement "
+            "(theme, stabilized_impact DESC, confidence_score, confidence_label, acceleration_arrow)"
+        )
+        conn.exec_driver_sql(
+            "CREATE INDEX IF NOT EXISTS ix_event_signal_date ON event (signal_type, date)"
+        )
+        conn.exec_driver_sql(
+            "CREATE INDEX IF NOT EXISTS ix_event_date_sig_tier ON event (date, signal_type, source_tier)"
+        )
+        conn.exec_driver_sql(
+            "CREATE INDEX IF NOT EXISTS ix_theme_snapshot_q_theme ON themesnapshot (quarter_id, theme)"
+        )
+        conn.commit()
 
 
 def get_session():
@@ -1,10 +1,27 @@
 from __future__ import annotations
 
+import time
+from collections import OrderedDict
 from datetime import datetime
-from typing import Any, Dict, List
+from typing import Dict, Tuple
+
+import orjson
 
 from engine.theme_brief import build_theme_briefs
 
+# Brief payloads only move when ingest/build runs, so concurrent and repeat
+# requests within the TTL share one computation instead of re-scanning events.
+# The cache holds the orjson-encoded bytes: the dict layer and the encode are
+# paid once per TTL, not once per request. The key comes from request query
+# params, so params are clamped and the cache is a small LRU — a client
+# cycling values can't grow it past _CACHE_MAX entries.
+_CACHE: "OrderedDict[Tuple[int, int], Tuple[float, bytes]]" = OrderedDict()
+_CACHE_MAX = 16
+_CACHE_TTL_S = 60.0
+
+_TOP_N_MAX = 12
+_EVENTS_PER_THEME_MAX = 10
+
 
 def _dt(d: datetime | None) -> str | None:
     if not d:
@@ -13,34 +30,54 @@ def _dt(d: datetime | None) -> str | None:
     return d.strftime("%Y-%m-%d")
 
 
-def get_frontier_theme_briefs(top_n: int = 6, events_per_theme: int = 5) -> Dict[str, Any]:
+def get_frontier_theme_briefs_json(top_n: int = 6, events_per_theme: int = 5) -> bytes:
+    """JSON payload for /api/frontier/themes, ready to send as-is."""
+    top_n = max(1, min(top_n, _TOP_N_MAX))
+    events_per_theme = max(1, min(events_per_theme, _EVENTS_PER_THEME_MAX))
+
+    key = (top_n, events_per_theme)
+    hit = _CACHE.get(key)
+    if hit and (time.monotonic() - hit[0]) < _CACHE_TTL_S:
+        _CACHE.move_to_end(key)
+        return hit[1]
+
     briefs = build_theme_briefs(top_n=top_n, events_per_theme=events_per_theme)
 
-    out: List[Dict[str, Any]] = []
-    for b in briefs:
-        out.append(
-            {
-                "theme": b.theme,
-                "score": b.score,
-                "why_now": b.why_now,
-                "board_question": b.board_question,
-                "channels": b.channels,
-                "first_seen": _dt(b.first_seen),
-                "count_90d": b.count_90d,
-                "count_365d": b.count_365d,
-                "accel_ratio": b.accel_ratio,
-                "evidence": [
-                    {
-                        "date": _dt(ev.date),
-                        "source_name": ev.source_name,
-                        "source_tier": int(getattr(ev, "source_tier", 3) or 3),
-                        "signal_type": ev.signal_type,
-                        "title": ev.title,
-                        "url": ev.url,
-                    }
-                    for ev in b.events
-                ],
-            }
-        )
-
-    return {"items": out, "top_n": top_n, "events_per_theme": events_per_theme}
+    out = [
+        {
+            "theme": b.theme,
+            "score": b.score,
+            "why_now": b.why_now,
+            "board_question": b.board_question,
+            "channels": b.channels,
+            "first_seen": _dt(b.first_seen),
+            "count_90d": b.count_90d,
+            "count_365d": b.count_365d,
+            "accel_ratio": b.accel_ratio,
+            "evidence": [
+                {
+                    "date": _dt(ev.date),
+                    "source_name": ev.source_name,
+                    "source_tier": int(getattr(ev, "source_tier", 3) or 3),
+                    "signal_type": ev.signal_type,
+                    "title": ev.title,
+                    "url": ev.url,
+                }
+                for ev in b.events
+            ],
+        }
+        for b in briefs
+    ]
+
+    payload = orjson.dumps({"items": out, "top_n": top_n, "events_per_theme": events_per_theme})
+    _CACHE[key] = (time.monotonic(), payload)
+    _CACHE.move_to_end(key)
+    if len(_CACHE) > _CACHE_MAX:
+        _CACHE.popitem(last=False)
+    return payload
+
+
+def get_frontier_theme_briefs(top_n: int = 6, events_per_theme: int = 5) -> Dict:
+    # Dict view for callers that want to post-process; the API route should
+    # use get_frontier_theme_briefs_json and skip the decode entirely.
+    return orjson.loads(get_frontier_theme_briefs_json(top_n=top_n, events_per_theme=events_per_theme))
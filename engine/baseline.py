@@ -4,6 +4,7 @@ from dataclasses import dataclass
 from datetime import datetime, timedelta
 from typing import Any, Dict, Iterator
 
+from sqlalchemy import case, func
 from sqlmodel import Session, select
 
 from models import Event, MovementEventLink
@@ -34,24 +35,21 @@ def baseline_counts_90d_for_movement(session: Session, movement_id: int) -> Base
     cutoff_90 = now - timedelta(days=90)
     cutoff_180 = now - timedelta(days=180)
 
-    links = session.exec(
-        select(MovementEventLink).where(MovementEventLink.movement_id == movement_id)
-    ).all()
-    ev_ids = [l.event_id for l in links if l.event_id is not None]
-    if not ev_ids:
-        return BaselineCounts(recent_90=0, baseline_90=0.0)
-
-    evs = session.exec(select(Event).where(Event.id.in_(ev_ids))).all()
-
-    recent_90 = 0
-    baseline_90 = 0
-    for e in evs:
-        if not getattr(e, "date", None):
-            continue
-        d = e.date
-        if d >= cutoff_90:
-            recent_90 += 1
-        elif cutoff_180 <= d < cutoff_90:
-            baseline_90 += 1
-
-    return BaselineCounts(recent_90=recent_90, baseline_90=float(baseline_90))
+    # Both window counts as one aggregate over the link join — no Event
+    # rows cross into Python at all
+    recent_90, baseline_90 = session.exec(
+        select(
+            func.coalesce(func.sum(case((Event.date >= cutoff_90, 1), else_=0)), 0),
+            func.coalesce(
+                func.sum(
+                    case(((Event.date >= cutoff_180) & (Event.date < cutoff_90), 1), else_=0)
+                ),
+                0,
+            ),
+        )
+        .select_from(MovementEventLink)
+        .join(Event, Event.id == MovementEventLink.event_id)
+        .where(MovementEventLink.movement_id == movement_id)
+    ).one()
+
+    return BaselineCounts(recent_90=int(recent_90), baseline_90=float(baseline_90))
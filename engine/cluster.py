@@ -3,25 +3,78 @@ from datetime import datetime, timedelta, timezone
 from typing import Dict, List
 
 import numpy as np
-from sklearn.cluster import AgglomerativeClustering
+from scipy.cluster.hierarchy import fcluster, linkage
+from scipy.sparse import csr_matrix
+from scipy.sparse.csgraph import connected_components
+from scipy.spatial.distance import squareform
 from sqlmodel import delete, select
 
 from database import get_session
 from engine.embed import embed_texts
 from models import Event, Movement, MovementEventLink
 
+# Above this size the agglomerative path's dense N x N distance matrix
+# stops being reasonable; switch to the kNN-graph route.
+_GRAPH_CLUSTER_MIN_N = 2048
+
+
+# Row-block size for the tiled similarity pass: peak extra memory is
+# _SIM_TILE_ROWS * N floats instead of the full N x N matrix.
+_SIM_TILE_ROWS = 512
+
+
+def _cluster_knn_graph(embeddings: np.ndarray, distance_threshold: float) -> List[int]:
+    """
+    Large-window clustering: link each event to its nearest neighbours within
+    the cosine threshold and take connected components. Single-linkage-style
+    at the same threshold, but O(N*k) memory instead of O(N^2).
+
+    Similarities come from tiled BLAS matmuls against the normalized
+    embeddings — each tile is (tile_rows x N), so the dense pairwise matrix
+    is never materialized.
+    """
+    n = len(embeddings)
+    k = min(20, n - 1)
+    emb = np.ascontiguousarray(embeddings, dtype=np.float32)
+    sim_floor = np.float32(1.0 - distance_threshold)
+
+    rows: List[int] = []
+    cols: List[int] = []
+    for start in range(0, n, _SIM_TILE_ROWS):
+        stop = min(start + _SIM_TILE_ROWS, n)
+        sims = emb[start:stop] @ emb.T  # (tile_rows, n)
+
+        # top-(k+1) per row; the +1 absorbs the self-match
+        part = np.argpartition(sims, -(k + 1), axis=1)[:, -(k + 1):]
+        for local_i, js in enumerate(part):
+            i = start + local_i
+            row_sims = sims[local_i]
+            for j in js:
+                if j != i and row_sims[j] >= sim_floor:
+                    rows.append(i)
+                    cols.append(int(j))
+
+    graph = csr_matrix((np.ones(len(rows)), (rows, cols)), shape=(n, n))
+    _, labels = connected_components(graph, directed=False)
+    return labels.tolist()
+
 
 def cluster_embeddings(embeddings: np.ndarray, distance_threshold: float = 0.55) -> List[int]:
     if len(embeddings) <= 1:
         return [0] * len(embeddings)
 
-    model = AgglomerativeClustering(
-        n_clusters=None,
-        metric="cosine",
-        linkage="average",
-        distance_threshold=distance_threshold,
-    )
-    labels = model.fit_predict(embeddings)
+    if len(embeddings) >= _GRAPH_CLUSTER_MIN_N:
+        return _cluster_knn_graph(embeddings, distance_threshold)
+
+    # Embeddings are L2-normalized, so cosine distance = 1 - dot product and
+    # the whole pairwise pass collapses into one FP32 BLAS matmul
+    emb = np.ascontiguousarray(embeddings, dtype=np.float32)
+    dist = 1.0 - emb @ emb.T
+    np.maximum(dist, 0.0, out=dist)  # guard tiny negative rounding
+    np.fill_diagonal(dist, 0.0)
+
+    Z = linkage(squareform(dist, checks=False), method="average")
+    labels = fcluster(Z, t=distance_threshold, criterion="distance")
     return labels.tolist()
 
 
@@ -30,24 +83,30 @@ def movement_uid_from_event_uids(event_uids: List[str]) -> str:
     return hashlib.sha256(core.encode("utf-8")).hexdigest()[:24]
 
 
+# Flattened (phrase, theme) pairs in priority order — built once at import
+# instead of re-allocating eight keyword lists on every call. The first
+# matching phrase wins, exactly like the old if-chain.
+_THEME_HINTS = tuple(
+    (phrase, theme)
+    for theme, phrases in (
+        ("Money & Deposit Architecture", ("deposit", "stablecoin", "cbdc", "tokenized deposit", "programmable money")),
+        ("Market Infrastructure & Settlement", ("settlement", "clearing", "dtcc", "euroclear", "collateral", "repo")),
+        ("Core Banking Architecture", ("core banking", "ledger", "banking platform", "mainframe", "modernization")),
+        ("Wealth & Asset Servicing", ("wealth", "custody", "asset servicing", "private markets", "tokenization of funds")),
+        ("Balance Sheet & Risk Architecture", ("capital", "liquidity", "risk model", "credit", "stress test")),
+        ("Identity, Privacy & Cryptography", ("zero-knowledge", "zkp", "mpc", "homomorphic", "post-quantum", "pqc", "privacy")),
+        ("Autonomous & Agentic Systems", ("agent", "autonomous", "agentic", "multi-agent")),
+        ("Regulatory & Monetary Shifts", ("regulation", "consultation", "ecb", "bis", "eba", "mas", "framework", "guidance")),
+    )
+    for phrase in phrases
+)
+
+
 def simple_theme_hint(text: str) -> str:
     t = text.lower()
-    if any(x in t for x in ["deposit", "stablecoin", "cbdc", "tokenized deposit", "programmable money"]):
-        return "Money & Deposit Architecture"
-    if any(x in t for x in ["settlement", "clearing", "dtcc", "euroclear", "collateral", "repo"]):
-        return "Market Infrastructure & Settlement"
-    if any(x in t for x in ["core banking", "ledger", "banking platform", "mainframe", "modernization"]):
-        return "Core Banking Architecture"
-    if any(x in t for x in ["wealth", "custody", "asset servicing", "private markets", "tokenization of funds"]):
-        return "Wealth & Asset Servicing"
-    if any(x in t for x in ["capital", "liquidity", "risk model", "credit", "stress test"]):
-        return "Balance Sheet & Risk Architecture"
-    if any(x in t for x in ["zero-knowledge", "zkp", "mpc", "homomorphic", "post-quantum", "pqc", "privacy"]):
-        return "Identity, Privacy & Cryptography"
-    if any(x in t for x in ["agent", "autonomous", "agentic", "multi-agent"]):
-        return "Autonomous & Agentic Systems"
-    if any(x in t for x in ["regulation", "consultation", "ecb", "bis", "eba", "mas", "framework", "guidance"]):
-        return "Regulatory & Monetary Shifts"
+    for phrase, theme in _THEME_HINTS:
+        if phrase in t:
+            return theme
     return "Regulatory & Monetary Shifts"
 
 
@@ -67,12 +126,14 @@ def build_movements(days: int = 365, distance_threshold: float = 0.55) -> int:
     for idx, lab in enumerate(labels):
         clusters.setdefault(lab, []).append(idx)
 
-    created = 0
     with get_session() as session:
+        # Everything — wipe, movements, links — in ONE transaction / commit
+        # instead of two commits (plus a refresh SELECT) per cluster
         session.exec(delete(MovementEventLink))
         session.exec(delete(Movement))
-        session.commit()
 
+        new_movements: List[Movement] = []
+        cluster_events: List[List[Event]] = []
         for lab, idxs in clusters.items():
             evs = [events[i] for i in idxs]
             ev_uids = [e.event_uid for e in evs]
@@ -82,21 +143,28 @@ def build_movements(days: int = 365, distance_threshold: float = 0.55) -> int:
             name = evs_sorted[0].title[:120] if evs_sorted else f"Movement {lab}"
             theme = simple_theme_hint(" ".join([e.title for e in evs_sorted[:5]]))
 
-            m = Movement(
-                movement_uid=uid,
-                name=name,
-                theme=theme,
-                created_at=datetime.utcnow(),
-                updated_at=datetime.utcnow(),
-                audit_json="{}",
+            new_movements.append(
+                Movement(
+                    movement_uid=uid,
+                    name=name,
+                    theme=theme,
+                    created_at=datetime.utcnow(),
+                    updated_at=datetime.utcnow(),
+                    audit_json={},
+                )
             )
-            session.add(m)
-            session.commit()
-            session.refresh(m)
-
-            for e in evs:
-                session.add(MovementEventLink(movement_id=m.id, event_id=e.id))
-            session.commit()
-            created += 1
+            cluster_events.append(evs)
+
+        session.add_all(new_movements)
+        session.flush()  # assigns movement PKs without committing
+
+        links = [
+            {"movement_id": m.id, "event_id": e.id}
+            for m, evs in zip(new_movements, cluster_events)
+            for e in evs
+        ]
+        if links:
+            session.bulk_insert_mappings(MovementEventLink, links)
+        session.commit()
 
-    return created
+    return len(new_movements)
@@ -3,7 +3,7 @@ from __future__ import annotations
 import re
 from collections import defaultdict
 from datetime import datetime, timedelta
-from typing import Dict, Set, List
+from typing import Dict, Set
 
 from sqlmodel import select
 
@@ -26,7 +26,7 @@ CHANNEL_SIGNAL_TYPES = {
 ENTITY_REGEX = re.compile(r"\b([A-Z][a-zA-Z0-9]{2,}(?:\s+[A-Z][a-zA-Z0-9]{2,})*)\b")
 
 # Hard stopwords (sentence starters, months, weekdays, etc.)
-STOP_PHRASES = {
+STOP_PHRASES = frozenset({
     "The","This","That","These","Those","Today","Tomorrow","Following",
     "January","February","March","April","May","June","July","August",
     "September","October","November","December",
@@ -34,25 +34,25 @@ STOP_PHRASES = {
     "And","For","With","From","Based","While","How","What","Once",
     "State","Update","Results","Communication",
     "United States","Europe","France","China","Russia","European",
-}
+})
 
 # Single-word junk we’ve observed in your corpus
-STOP_SINGLE = {
+STOP_SINGLE = frozenset({
     "However","Next","Additional","Additionally","When","Although","First","Second","There","Free",
     "Because","Analysis","Instead","During","Note","Some","Most","After","Real","Current","Model",
     "Network","Safety","Secure","Trust","Security","Press","News","Report","Global","International",
     "Market","Capital","Technology","Research","Python","Windows","HTML","API",
-}
+})
 
 # Allowlist for single-word entities (v1). We can grow this over time.
-ALLOW_SINGLE = {
+ALLOW_SINGLE = frozenset({
     "OpenAI","Microsoft","Amazon","Google","Apple","Meta","Nvidia","NVidia",
     "Visa","Mastercard","PayPal","Stripe","Adyen","Revolut","Klarna",
     "SWIFT","Swift","BIS","ECB","Fed","FOMC","BoE","CISA","NCSC","FINRA","DTCC","Nasdaq",
     "SEC","EBA","ESMA","EIOPA",
     "AWS","Azure",
     "ChatGPT","LLM","LLMs",
-}
+})
 
 def extract_entities(text: str) -> Set[str]:
     """
@@ -63,32 +63,31 @@ def extract_entities(text: str) -> Set[str]:
     if not text:
         return set()
 
-    matches: List[str] = ENTITY_REGEX.findall(text)
     out: Set[str] = set()
 
-    for m in matches:
-        m = m.strip()
-        if not m:
-            continue
+    # Bind hot lookups locally; the regex only matches [A-Za-z0-9]-bounded
+    # phrases so there is no whitespace to strip per match.
+    stop_phrases = STOP_PHRASES
+    stop_single = STOP_SINGLE
+    allow_single = ALLOW_SINGLE
 
+    for m in ENTITY_REGEX.findall(text):
         # Drop exact phrase stopwords
-        if m in STOP_PHRASES:
+        if m in stop_phrases:
             continue
 
         # Tokenize
         parts = m.split()
 
-        # Drop if any token is very short
-        if any(len(p) < 3 for p in parts):
+        # Single-word policy: allowlist only (checked first — the allowlist
+        # is the smallest set and rejects most single tokens immediately)
+        if len(parts) == 1:
+            if m in allow_single and m not in stop_single:
+                out.add(m)
             continue
 
-        # Single-word policy: allowlist only
-        if len(parts) == 1:
-            if m in STOP_SINGLE:
-                continue
-            if m not in ALLOW_SINGLE:
-                continue
-            out.add(m)
+        # Drop if any token is very short
+        if any(len(p) < 3 for p in parts):
             continue
 
         # Multi-word policy: filter obvious sentence-starter junk
@@ -108,17 +107,26 @@ def compute_cross_channel_correlations(days: int = 30):
     cutoff = datetime.utcnow() - timedelta(days=days)
     entity_channels: Dict[str, Set[str]] = defaultdict(set)
 
+    # Stream in chunks instead of materializing the window: the accumulator
+    # is incremental, so peak memory stays at one chunk of rows
     with get_session() as session:
-        events = session.exec(select(Event).where(Event.date >= cutoff)).all()
+        events = session.exec(
+            select(Event).where(Event.date >= cutoff).execution_options(yield_per=1000)
+        )
 
-    for e in events:
-        channel = CHANNEL_SIGNAL_TYPES.get(e.signal_type)
-        if not channel:
-            continue
+        for e in events:
+            channel = CHANNEL_SIGNAL_TYPES.get(e.signal_type)
+            if not channel:
+                continue
 
-        text = f"{e.title or ''} {e.summary or ''}"
-        for ent in extract_entities(text):
-            entity_channels[ent].add(channel)
+            # Prefer entities cached on the row at ingest; extraction only
+            # runs for rows ingested before the cache existed
+            if e.entities:
+                ents = e.entities.split(",")
+            else:
+                ents = extract_entities(f"{e.title or ''} {e.summary or ''}")
+            for ent in ents:
+                entity_channels[ent].add(channel)
 
     results = []
     for ent, channels in entity_channels.items():
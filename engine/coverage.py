@@ -2,7 +2,6 @@ from __future__ import annotations
 
 from collections import defaultdict
 from datetime import datetime, timedelta
-from typing import Dict
 
 from sqlmodel import select
 
@@ -25,26 +24,29 @@ CHANNEL_SIGNAL_TYPES = {
 def compute_coverage(days: int = 30):
     cutoff = datetime.utcnow() - timedelta(days=days)
 
-    by_channel = defaultdict(list)
+    # The report only needs counts, so fetch just the two grouping columns —
+    # no Event hydration and no per-channel object lists
+    totals = defaultdict(int)
     by_source = defaultdict(lambda: defaultdict(int))
 
     with get_session() as session:
-        events = session.exec(
-            select(Event).where(Event.date >= cutoff)
-        ).all()
+        rows = session.exec(
+            select(Event.signal_type, Event.source_name)
+            .where(Event.date >= cutoff)
+            .execution_options(yield_per=1000)
+        )
 
-    for e in events:
-        channel = CHANNEL_SIGNAL_TYPES.get(e.signal_type)
-        if not channel:
-            continue
+        for signal_type, source_name in rows:
+            channel = CHANNEL_SIGNAL_TYPES.get(signal_type)
+            if not channel:
+                continue
 
-        by_channel[channel].append(e)
-        by_source[channel][e.source_name] += 1
+            totals[channel] += 1
+            by_source[channel][source_name] += 1
 
     report = {}
 
-    for channel, events in by_channel.items():
-        total = len(events)
+    for channel, total in totals.items():
         unique_sources = len(by_source[channel])
 
         # concentration
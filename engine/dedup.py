@@ -4,7 +4,10 @@ from typing import Any, Dict, List
 
 def canonical_uid(source_name: str, url: str, title: str, date_iso: str) -> str:
     base = f"{source_name}|{url.strip()}|{title.strip()}|{date_iso}"
-    return hashlib.sha256(base.encode("utf-8")).hexdigest()[:32]
+    # Dedup UID, not a security boundary: blake2b is the fastest stdlib
+    # hash, and digest_size=16 gives the 32 hex chars directly instead of
+    # computing 64 and truncating
+    return hashlib.blake2b(base.encode("utf-8"), digest_size=16).hexdigest()
 
 
 def dedup_items(items: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
@@ -1,4 +1,5 @@
 import json
+from functools import lru_cache
 from typing import List
 
 import numpy as np
@@ -6,18 +7,48 @@ import numpy as np
 from config import settings
 
 
-def embed_texts(texts: List[str]) -> np.ndarray:
-    # SentenceTransformers embeddings
+@lru_cache(maxsize=1)
+def _model():
+    # Loading the model re-reads hundreds of MB of weights; do it once
+    # per process, lazily (first embed call), not per embed_texts call.
     from sentence_transformers import SentenceTransformer
 
-    model = SentenceTransformer(settings.embed_model)
-    emb = model.encode(texts, normalize_embeddings=True, show_progress_bar=False)
-    return np.array(emb, dtype=np.float32)
+    m = SentenceTransformer(settings.embed_model)
+    m.eval()
+    return m
+
+
+def embed_texts(texts: List[str]) -> np.ndarray:
+    # SentenceTransformers embeddings
+    emb = _model().encode(
+        texts,
+        batch_size=64,
+        normalize_embeddings=True,
+        convert_to_numpy=True,
+        show_progress_bar=False,
+    )
+    return np.asarray(emb, dtype=np.float32)
+
+
+def quantize_vec(vec) -> tuple:
+    """
+    Symmetric int8 quantization with a per-vector scale. ~4x smaller than
+    float32 and plenty for cosine-threshold clustering.
+    """
+    v = np.asarray(vec, dtype=np.float32)
+    scale = float(np.max(np.abs(v))) or 1.0
+    q = np.clip(np.round(v / scale * 127.0), -127, 127).astype(np.int8)
+    return q, scale
 
 
 def dumps_vec(vec) -> str:
-    return json.dumps([float(x) for x in vec])
+    q, scale = quantize_vec(vec)
+    return json.dumps({"s": scale, "q": q.tolist()})
 
 
 def loads_vec(s: str):
-    return np.array(json.loads(s), dtype=np.float32)
+    data = json.loads(s)
+    if isinstance(data, list):
+        # legacy format: plain float list
+        return np.array(data, dtype=np.float32)
+    return np.array(data["q"], dtype=np.float32) * (data["s"] / 127.0)
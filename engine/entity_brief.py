@@ -2,6 +2,7 @@ from __future__ import annotations
 
 from dataclasses import dataclass
 from datetime import datetime, timedelta
+from functools import lru_cache
 from typing import Dict, List, Tuple, Set
 
 from sqlmodel import select
@@ -45,8 +46,8 @@ def _pair_key(a: str, b: str) -> Tuple[str, str]:
     return (a, b) if a <= b else (b, a)
 
 
-def convergence_score(channels: List[str]) -> float:
-    chs = sorted(set(channels))
+@lru_cache(maxsize=256)
+def _convergence_score_cached(chs: Tuple[str, ...]) -> float:
     score = 0.0
     for i in range(len(chs)):
         for j in range(i + 1, len(chs)):
@@ -56,6 +57,12 @@ def convergence_score(channels: List[str]) -> float:
     return round(score, 2)
 
 
+def convergence_score(channels: List[str]) -> float:
+    # Only 8 channels exist, so there are at most 2^8 distinct channel sets —
+    # the cache turns the per-entity pairwise loop into a dict hit
+    return _convergence_score_cached(tuple(sorted(set(channels))))
+
+
 def normalize_entity(entity: str) -> str:
     entity = entity.strip()
     if entity in ALIASES:
@@ -75,9 +82,11 @@ def is_entity_useful(entity: str) -> bool:
     return True
 
 
-def _contains_entity(ev: Event, entity: str) -> bool:
-    hay = ((ev.title or "") + " " + (ev.summary or "")).lower()
-    return entity.lower() in hay
+def _contains_entity(ev: Event, needle_lc: str) -> bool:
+    # needle_lc must be pre-lowercased — callers hoist the .lower() out of
+    # their per-event loops
+    hay = ev.haystack_lc or ((ev.title or "") + " " + (ev.summary or "")).lower()
+    return needle_lc in hay
 
 
 def _channel_from_signal_type(ev: Event) -> str:
@@ -95,6 +104,14 @@ def _channel_from_signal_type(ev: Event) -> str:
     }.get(st, "unknown")
 
 
+def _load_window(days: int) -> List[Event]:
+    cutoff = datetime.utcnow() - timedelta(days=days)
+    with get_session() as session:
+        return session.exec(
+            select(Event).where(Event.date >= cutoff).order_by(Event.date.desc())
+        ).all()
+
+
 def select_events_balanced(entity: str, days: int = 30, limit: int = 6, per_source_cap: int = 2) -> List[Event]:
     """
     Pick events in a board-friendly way:
@@ -102,13 +119,15 @@ def select_events_balanced(entity: str, days: int = 30, limit: int = 6, per_sour
     - cap per source to avoid arXiv spam
     - then fill remaining slots by recency
     """
-    cutoff = datetime.utcnow() - timedelta(days=days)
-    with get_session() as session:
-        events = session.exec(select(Event).where(Event.date >= cutoff).order_by(Event.date.desc())).all()
+    events = _load_window(days)
 
     # filter matches
-    matches: List[Event] = [ev for ev in events if _contains_entity(ev, entity)]
+    ent_lc = entity.lower()
+    matches: List[Event] = [ev for ev in events if _contains_entity(ev, ent_lc)]
+    return _pick_balanced(matches, limit, per_source_cap)
+
 
+def _pick_balanced(matches: List[Event], limit: int, per_source_cap: int) -> List[Event]:
     # group by channel, keep recency order
     by_channel: Dict[str, List[Event]] = {}
     for ev in matches:
@@ -116,6 +135,7 @@ def select_events_balanced(entity: str, days: int = 30, limit: int = 6, per_sour
         by_channel.setdefault(ch, []).append(ev)
 
     selected: List[Event] = []
+    selected_ids: Set[int] = set()
     used_sources: Dict[str, int] = {}
     used_channels: Set[str] = set()
 
@@ -126,6 +146,7 @@ def select_events_balanced(entity: str, days: int = 30, limit: int = 6, per_sour
             if used_sources.get(src, 0) >= per_source_cap:
                 continue
             selected.append(ev)
+            selected_ids.add(id(ev))
             used_sources[src] = used_sources.get(src, 0) + 1
             used_channels.add(ch)
             break
@@ -136,7 +157,7 @@ def select_events_balanced(entity: str, days: int = 30, limit: int = 6, per_sour
     for ev in matches:
         if len(selected) >= limit:
             break
-        if ev in selected:
+        if id(ev) in selected_ids:
             continue
         src = ev.source_name or "unknown"
         if used_sources.get(src, 0) >= per_source_cap:
@@ -167,6 +188,11 @@ def build_entity_briefs(days: int = 30, top_n: int = 20, events_per_entity: int
             continue
         merged.setdefault(ent, set()).update(r["channels"])
 
+    # One window load + one lowercase pass shared by every entity, instead
+    # of a fresh full-window query per entity inside select_events_balanced
+    events = _load_window(days)
+    hays = [ev.haystack_lc or ((ev.title or "") + " " + (ev.summary or "")).lower() for ev in events]
+
     briefs: List[EntityBrief] = []
     for ent, chs_set in merged.items():
         chs = sorted(chs_set)
@@ -174,7 +200,9 @@ def build_entity_briefs(days: int = 30, top_n: int = 20, events_per_entity: int
         if cc < 2:
             continue
         score = convergence_score(chs)
-        evs = select_events_balanced(ent, days=days, limit=events_per_entity, per_source_cap=2)
+        ent_lower = ent.lower()
+        matches = [ev for ev, hay in zip(events, hays) if ent_lower in hay]
+        evs = _pick_balanced(matches, limit=events_per_entity, per_source_cap=2)
         briefs.append(EntityBrief(entity=ent, channels=chs, channel_count=cc, score=score, events=evs))
 
     briefs.sort(key=lambda b: (b.score, b.channel_count), reverse=True)
@@ -1,9 +1,13 @@
 from __future__ import annotations
 
+import sys
 from dataclasses import dataclass
-from datetime import datetime, timedelta
+from datetime import date, datetime, timedelta
+from functools import lru_cache
 from typing import Dict, List, Set, Tuple
 
+import numpy as np
+from sqlalchemy import case, func
 from sqlmodel import select
 
 from database import get_session
@@ -16,25 +20,29 @@ from engine.entity_brief import (
     select_events_balanced,
 )
 
-# signal_type -> channel_key
+# signal_type -> channel_key (interned: these exact strings flow through
+# per-event dict/set lookups, so identity-based comparison pays off)
 SIGNAL_TO_CHANNEL = {
-    "regulatory": "regulatory_policy",
-    "macro": "central_banking_macro",
-    "capital": "capital_flows_markets",
-    "competitive": "competitive_moves_fs",
-    "technology": "technology_ai_infra",
-    "cyber": "cyber_fraud_resilience",
-    "cross_industry": "cross_industry_signals",
-    "research": "research_standards",
+    sys.intern(k): sys.intern(v)
+    for k, v in {
+        "regulatory": "regulatory_policy",
+        "macro": "central_banking_macro",
+        "capital": "capital_flows_markets",
+        "competitive": "competitive_moves_fs",
+        "technology": "technology_ai_infra",
+        "cyber": "cyber_fraud_resilience",
+        "cross_industry": "cross_industry_signals",
+        "research": "research_standards",
+    }.items()
 }
 
 # High-auth channels = where board actually acts
-HIGH_AUTH_CHANNELS = {
+HIGH_AUTH_CHANNELS = frozenset({
     "capital_flows_markets",
     "regulatory_policy",
     "central_banking_macro",
     "competitive_moves_fs",
-}
+})
 
 # "Frontier maturity" bonus pr channel (board logic)
 CHANNEL_MATURITY_WEIGHT = {
@@ -50,7 +58,7 @@ CHANNEL_MATURITY_WEIGHT = {
 
 # Generic umbrella terms that easily dominate but aren’t board-actionable alone.
 # (We keep them, but require them to clear high-auth + accel/novelty gates.)
-GENERIC_THEME_ENTITIES = {"LLM", "LLMs", "API", "APIs"}
+GENERIC_THEME_ENTITIES = frozenset({"LLM", "LLMs", "API", "APIs"})
 
 
 @dataclass
@@ -72,19 +80,27 @@ def _channel_of_event(ev: Event) -> str:
     return SIGNAL_TO_CHANNEL.get((ev.signal_type or "").strip(), "unknown")
 
 
-def _contains_entity(ev: Event, entity: str) -> bool:
-    hay = ((ev.title or "") + " " + (ev.summary or "")).lower()
-    return entity.lower() in hay
+# Lowered title+summary — reads the column materialized at ingest, falling
+# back to lowering in SQLite for pre-migration rows
+_HAY = func.coalesce(Event.haystack_lc, func.lower(Event.title + " " + Event.summary))
 
 
-def _first_seen(entity: str) -> datetime | None:
-    # simple scan (ok for now)
+def _like_contains(needle: str) -> str:
+    escaped = needle.lower().replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+    return f"%{escaped}%"
+
+
+@lru_cache(maxsize=4096)
+def _first_seen_cached(entity: str, day: date) -> datetime | None:
     with get_session() as session:
-        events = session.exec(select(Event).order_by(Event.date.asc())).all()
-    for e in events:
-        if _contains_entity(e, entity):
-            return e.date
-    return None
+        return session.exec(
+            select(func.min(Event.date)).where(_HAY.like(_like_contains(entity), escape="\\"))
+        ).one()
+
+
+def _first_seen(entity: str) -> datetime | None:
+    # stable once known; the day key just bounds staleness across ingests
+    return _first_seen_cached(entity, datetime.utcnow().date())
 
 
 def _counts_and_flags(entity: str) -> Tuple[int, int, Set[str], bool, bool, bool]:
@@ -102,25 +118,32 @@ def _counts_and_flags(entity: str) -> Tuple[int, int, Set[str], bool, bool, bool
     has_tier1_high_auth = False
     has_any_high_auth = False
 
+    # One grouped aggregate per entity: SQLite scans the window in C and we
+    # only fold a handful of (signal_type, counts, tier flag) rows here
     with get_session() as session:
-        events = session.exec(select(Event).where(Event.date >= cutoff_365)).all()
-
-    for ev in events:
-        if not _contains_entity(ev, entity):
-            continue
-
-        count_365 += 1
-        if ev.date and ev.date >= cutoff_90:
-            count_90 += 1
-
-        ch = _channel_of_event(ev)
+        rows = session.exec(
+            select(
+                Event.signal_type,
+                func.count(),
+                func.coalesce(func.sum(case((Event.date >= cutoff_90, 1), else_=0)), 0),
+                func.max(case((Event.source_tier == 1, 1), else_=0)),
+            )
+            .where(Event.date >= cutoff_365)
+            .where(_HAY.like(_like_contains(entity), escape="\\"))
+            .group_by(Event.signal_type)
+        ).all()
+
+    for signal_type, c365, c90, any_tier1 in rows:
+        count_365 += c365
+        count_90 += c90
+
+        ch = SIGNAL_TO_CHANNEL.get((signal_type or "").strip(), "unknown")
         if ch != "unknown":
             channels.add(ch)
             if ch in HIGH_AUTH_CHANNELS:
                 has_any_high_auth = True
 
-        tier = int(getattr(ev, "source_tier", 3) or 3)
-        if tier == 1:
+        if any_tier1:
             has_tier1 = True
             if ch in HIGH_AUTH_CHANNELS:
                 has_tier1_high_auth = True
@@ -132,10 +155,10 @@ def _maturity_bonus(channels: Set[str]) -> float:
     return round(sum(CHANNEL_MATURITY_WEIGHT.get(c, 0.5) for c in channels), 2)
 
 
-def _novelty_bonus(first_seen: datetime | None) -> float:
+def _novelty_bonus(first_seen: datetime | None, now: datetime | None = None) -> float:
     if not first_seen:
         return 0.0
-    days = (datetime.utcnow() - first_seen).days
+    days = ((now or datetime.utcnow()) - first_seen).days
     if days <= 30:
         return 1.5
     if days <= 90:
@@ -174,6 +197,7 @@ def _passes_frontier_gate(
     first_seen: datetime | None,
     accel_ratio: float,
     has_any_high_auth: bool,
+    now: datetime | None = None,
 ) -> bool:
     """
     Board-grade frontier gate:
@@ -185,7 +209,7 @@ def _passes_frontier_gate(
 
     novelty_ok = False
     if first_seen:
-        novelty_ok = (datetime.utcnow() - first_seen).days <= 90
+        novelty_ok = ((now or datetime.utcnow()) - first_seen).days <= 90
 
     accel_ok = accel_ratio >= 1.5
 
@@ -196,25 +220,30 @@ def _passes_frontier_gate(
     return accel_ok or novelty_ok
 
 
-def frontier_score(entity: str) -> FrontierItem | None:
-    entity = normalize_entity(entity)
-    if not is_entity_useful(entity):
-        return None
-
-    first = _first_seen(entity)
-    c90, c365, chs, has_tier1, has_tier1_high_auth, has_any_high_auth = _counts_and_flags(entity)
-
+def _score_from_stats(
+    entity: str,
+    first: datetime | None,
+    c90: int,
+    c365: int,
+    chs: Set[str],
+    has_tier1: bool,
+    has_tier1_high_auth: bool,
+    has_any_high_auth: bool,
+    now: datetime | None = None,
+) -> FrontierItem | None:
     if len(chs) < 2:
         return None
 
+    now = now or datetime.utcnow()
+
     accel_bonus, accel_ratio = _accel_bonus(c90, c365)
 
-    if not _passes_frontier_gate(entity, chs, first, accel_ratio, has_any_high_auth):
+    if not _passes_frontier_gate(entity, chs, first, accel_ratio, has_any_high_auth, now=now):
         return None
 
     base = convergence_score(sorted(chs))
     maturity = _maturity_bonus(chs)
-    novelty = _novelty_bonus(first)
+    novelty = _novelty_bonus(first, now=now)
 
     authority_bonus = 0.0
     if has_tier1_high_auth:
@@ -239,6 +268,89 @@ def frontier_score(entity: str) -> FrontierItem | None:
     )
 
 
+@lru_cache(maxsize=4096)
+def _frontier_score_cached(entity: str, day: date) -> FrontierItem | None:
+    # Counts first: most candidates fail the channel/high-auth gate, and
+    # rejecting them here skips the full-table first-seen scan entirely
+    c90, c365, chs, has_tier1, has_tier1_high_auth, has_any_high_auth = _counts_and_flags(entity)
+    if len(chs) < 2 or not has_any_high_auth:
+        return None
+
+    first = _first_seen(entity)
+    return _score_from_stats(entity, first, c90, c365, chs, has_tier1, has_tier1_high_auth, has_any_high_auth)
+
+
+def frontier_score(entity: str) -> FrontierItem | None:
+    """
+    Single-entity scoring against the DB — use score_entities_bulk for lists.
+    Deterministic within a day (cutoffs move at day granularity), so repeat
+    calls are cache hits keyed on (entity, today).
+    """
+    entity = normalize_entity(entity)
+    if not is_entity_useful(entity):
+        return None
+    return _frontier_score_cached(entity, datetime.utcnow().date())
+
+
+def score_entities_bulk(entities: List[str]) -> Dict[str, FrontierItem]:
+    """
+    Score many candidates against ONE event read instead of three queries per
+    entity. The window is projected into arrays once; each entity then costs a
+    vectorized substring search plus a few boolean reductions.
+    """
+    now = datetime.utcnow()
+    cutoff_365 = now - timedelta(days=365)
+    cutoff_90 = now - timedelta(days=90)
+
+    with get_session() as session:
+        rows = session.exec(
+            select(Event.date, Event.signal_type, Event.source_tier, _HAY)
+            .order_by(Event.date.asc())
+        ).all()
+
+    out: Dict[str, FrontierItem] = {}
+    if not rows:
+        return out
+
+    dates = [r[0] for r in rows]
+    hays = np.array([r[3] or "" for r in rows])
+    date_arr = np.array(dates, dtype="datetime64[s]")
+
+    # Rows are date-ascending, so each window is just a tail slice starting
+    # at its searchsorted boundary — no per-row window masks needed, and
+    # window counts are sums over trailing slices
+    i365 = int(np.searchsorted(date_arr, np.datetime64(cutoff_365)))
+    i90 = int(np.searchsorted(date_arr, np.datetime64(cutoff_90)))
+
+    row_channels = np.array(
+        [SIGNAL_TO_CHANNEL.get((r[1] or "").strip(), "unknown") for r in rows[i365:]]
+    )
+    high_auth = np.isin(row_channels, list(HIGH_AUTH_CHANNELS))
+    tier1 = np.array([int(r[2] or 3) == 1 for r in rows[i365:]])
+
+    for entity in entities:
+        mask = np.char.find(hays, entity.lower()) >= 0
+        if not mask.any():
+            continue
+
+        first = dates[int(mask.argmax())]  # rows are date-ascending
+
+        m365 = mask[i365:]
+        c365 = int(m365.sum())
+        c90 = int(mask[i90:].sum())
+
+        chs = set(np.unique(row_channels[m365])) - {"unknown"}
+        has_any_high_auth = bool((m365 & high_auth).any())
+        has_tier1 = bool((m365 & tier1).any())
+        has_tier1_high_auth = bool((m365 & tier1 & high_auth).any())
+
+        fi = _score_from_stats(entity, first, c90, c365, chs, has_tier1, has_tier1_high_auth, has_any_high_auth, now=now)
+        if fi:
+            out[entity] = fi
+
+    return out
+
+
 def build_frontier_watchlist(days: int = 365, top_n: int = 20) -> List[FrontierItem]:
     """
     Candidates come from correlation engine (days window), but scoring uses 365d baseline.
@@ -247,18 +359,16 @@ def build_frontier_watchlist(days: int = 365, top_n: int = 20) -> List[FrontierI
 
     candidates = compute_cross_channel_correlations(days=days)
     seen: Set[str] = set()
-    items: List[FrontierItem] = []
+    ents: List[str] = []
 
     for r in candidates:
         ent = normalize_entity(r["entity"])
-        if ent in seen:
+        if ent in seen or not is_entity_useful(ent):
             continue
         seen.add(ent)
+        ents.append(ent)
 
-        fi = frontier_score(ent)
-        if fi:
-            items.append(fi)
-
+    items = list(score_entities_bulk(ents).values())
     items.sort(key=lambda x: x.frontier_score, reverse=True)
     return items[:top_n]
 
@@ -1,7 +1,9 @@
 from __future__ import annotations
 
-from dataclasses import dataclass
+import re
+from dataclasses import dataclass, field
 from datetime import datetime, timedelta
+from functools import lru_cache
 from typing import Dict, List, Set, Tuple
 
 from sqlmodel import select
@@ -12,6 +14,7 @@ from models import Event
 from engine.frontier import (
     SIGNAL_TO_CHANNEL,
     HIGH_AUTH_CHANNELS,
+    _HAY,
     _accel_bonus,
     _novelty_bonus,
 )
@@ -39,64 +42,94 @@ class ThemeItem:
 
 
 def _text(ev: Event) -> str:
-    return f"{ev.title or ''} {ev.summary or ''}".lower()
+    return ev.haystack_lc or f"{ev.title or ''} {ev.summary or ''}".lower()
 
 
 def _channel(ev: Event) -> str:
     return SIGNAL_TO_CHANNEL.get((ev.signal_type or "").strip(), "unknown")
 
 
-def _match_theme(ev: Event, keywords: List[str]) -> bool:
-    t = _text(ev)
-    return any(k in t for k in keywords)
+@lru_cache(maxsize=64)
+def _keyword_pattern(keywords: Tuple[str, ...]) -> re.Pattern:
+    # One compiled alternation per keyword set: the C regex engine scans the
+    # text once instead of |keywords| separate substring passes
+    return re.compile("|".join(re.escape(k) for k in keywords))
 
 
-def _first_seen_theme(theme: str, keywords: List[str]) -> datetime | None:
-    with get_session() as session:
-        events = session.exec(select(Event).order_by(Event.date.asc())).all()
-    for ev in events:
-        if _match_theme(ev, keywords):
-            return ev.date
-    return None
+def _match_theme(ev: Event, keywords: List[str]) -> bool:
+    return _keyword_pattern(tuple(keywords)).search(_text(ev)) is not None
 
 
-def _counts_theme(theme: str, keywords: List[str]) -> Tuple[int, int, Set[str], bool]:
+@dataclass
+class _ThemeStats:
+    first_seen: datetime | None = None
+    c90: int = 0
+    c365: int = 0
+    channels: Set[str] = field(default_factory=set)
+    has_high_auth: bool = False
+
+
+def _compute_all_theme_stats() -> Dict[str, _ThemeStats]:
+    """
+    One projected event scan covering every theme at once: first_seen falls
+    out of the ascending order, window counts and channel flags accumulate
+    per theme as each row is matched. Replaces two queries per theme.
+    """
     now = datetime.utcnow()
     cutoff_365 = now - timedelta(days=365)
     cutoff_90 = now - timedelta(days=90)
 
-    c365 = 0
-    c90 = 0
-    chs: Set[str] = set()
-    has_high_auth = False
+    patterns = [(theme, _keyword_pattern(tuple(kws))) for theme, kws in THEMES.items()]
+    stats = {theme: _ThemeStats() for theme in THEMES}
 
+    # Counters are incremental, so stream the scan instead of holding the
+    # whole projected table at once
     with get_session() as session:
-        events = session.exec(select(Event).where(Event.date >= cutoff_365)).all()
+        rows = session.exec(
+            select(Event.date, Event.signal_type, _HAY)
+            .order_by(Event.date.asc())
+            .execution_options(yield_per=1000)
+        )
 
-    for ev in events:
-        if not _match_theme(ev, keywords):
-            continue
+        for date, signal_type, hay in rows:
+            hay = hay or ""
+            in_365 = date >= cutoff_365
+            ch = None  # resolved lazily, once per row
+            for theme, pat in patterns:
+                if pat.search(hay) is None:
+                    continue
+
+                st = stats[theme]
+                if st.first_seen is None:
+                    st.first_seen = date
 
-        c365 += 1
-        if ev.date and ev.date >= cutoff_90:
-            c90 += 1
+                if not in_365:
+                    continue
+                st.c365 += 1
+                if date >= cutoff_90:
+                    st.c90 += 1
 
-        ch = _channel(ev)
-        if ch != "unknown":
-            chs.add(ch)
-            if ch in HIGH_AUTH_CHANNELS:
-                has_high_auth = True
+                if ch is None:
+                    ch = SIGNAL_TO_CHANNEL.get((signal_type or "").strip(), "unknown")
+                if ch != "unknown":
+                    st.channels.add(ch)
+                    if ch in HIGH_AUTH_CHANNELS:
+                        st.has_high_auth = True
 
-    return c90, c365, chs, has_high_auth
+    return stats
 
 
 def compute_theme_watchlist(top_n: int = 10) -> List[ThemeItem]:
+    all_stats = _compute_all_theme_stats()
+    now = datetime.utcnow()
+
     items: List[ThemeItem] = []
-    for theme, keywords in THEMES.items():
-        first = _first_seen_theme(theme, keywords)
-        c90, c365, chs, has_high_auth = _counts_theme(theme, keywords)
+    for theme in THEMES:
+        st = all_stats[theme]
+        first = st.first_seen
+        c90, c365, chs, has_high_auth = st.c90, st.c365, st.channels, st.has_high_auth
         accel_bonus, accel_ratio = _accel_bonus(c90, c365)
-        novelty = _novelty_bonus(first)
+        novelty = _novelty_bonus(first, now=now)
 
         # gate: needs >=2 channels or high-auth presence
         if len(chs) < 2 and not has_high_auth:
@@ -1,15 +1,26 @@
 from __future__ import annotations
 
 import hashlib
-import inspect
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from concurrent.futures import TimeoutError as FutureTimeoutError
 from datetime import datetime, timezone
 from typing import Iterable, List
 
-from sqlmodel import select
-
-from database import get_session
+from connectors.registry import _fetch_is_days_only as registry_fetch_is_days_only
+from database import get_session, upsert
+from engine.correlation import extract_entities
 from models import Event
 
+# Multi-VALUES insert batch size: ~11 columns per row, kept well under
+# SQLite's bound-parameter limit
+_INSERT_BATCH = 500
+
+
+def _chunked(seq: List, size: int):
+    # generator, not a list of lists — never holds a second copy of seq
+    for i in range(0, len(seq), size):
+        yield seq[i : i + size]
+
 
 def _stable_event_uid(source_name: str, url: str | None, title: str | None, date: datetime | None) -> str:
     d = ""
@@ -25,7 +36,9 @@ def _stable_event_uid(source_name: str, url: str | None, title: str | None, date
             d,
         ]
     )
-    return hashlib.sha1(base.encode("utf-8")).hexdigest()
+    # blake2b is the fastest hash in hashlib and this is a dedup key, not a
+    # security boundary; 20 bytes keeps collisions out of reach
+    return hashlib.blake2b(base.encode("utf-8"), digest_size=20).hexdigest()
 
 
 def _parse_date(v) -> datetime | None:
@@ -55,91 +68,139 @@ def normalize_item(item: dict, source_name: str, source_tier: int, signal_type:
     if not event_uid:
         event_uid = _stable_event_uid(source_name, url, title, date)
 
+    title = (title or "").strip()
+    summary = summary.strip() if isinstance(summary, str) else ""
+
+    # Extract entities once at ingest so report paths can read them off the
+    # row instead of re-running the regex per report
+    entities = ",".join(sorted(extract_entities(f"{title} {summary}"))) or None
+
     return {
+        "haystack_lc": f"{title} {summary}".lower(),
         "event_uid": event_uid,
-        "title": (title or "").strip(),
-        "summary": summary.strip() if isinstance(summary, str) else "",
+        "title": title,
+        "summary": summary,
         "url": url,
         "date": date,
         "source_name": source_name,
         "source_tier": int(source_tier),
         "signal_type": signal_type,
+        "entities": entities,
     }
 
 
-def _fetch_is_days_only(fetch) -> bool:
+def _fetch_is_days_only(spec) -> bool:
     """
     Only run connectors that can be called as fetch(days=...).
     If fetch requires other required positional args (e.g. feed_url), skip it.
+    ConnectorSpec resolves this once at registration; the signature check
+    here only runs for duck-typed specs without the cached flag.
     """
-    try:
-        sig = inspect.signature(fetch)
-    except Exception:
-        return True
-
-    for p in sig.parameters.values():
-        if p.kind in (p.POSITIONAL_ONLY, p.POSITIONAL_OR_KEYWORD):
-            if p.name == "days":
-                continue
-            if p.default is inspect._empty:
-                return False
-    return True
+    cached = getattr(spec, "fetch_days_only", None)
+    if cached is not None:
+        return cached
+    return registry_fetch_is_days_only(spec.fetch)
 
 
 def ingest_from_connectors(connectors: Iterable, days: int = 365) -> int:
     inserted = 0
 
-    with get_session() as session:
-        for i, spec in enumerate(connectors, start=1):
-            name = getattr(spec, "name", "unknown")
-            src = getattr(spec, "source_name", "unknown")
-            tier = getattr(spec, "source_tier", 3)
-            sig = getattr(spec, "signal_type", "research")
-            fetch = getattr(spec, "fetch", None)
-
-            if not callable(fetch):
-                print(f"[ingest] skipping template connector {name} (no fetch)")
-                continue
+    runnable = []
+    for spec in connectors:
+        name = getattr(spec, "name", "unknown")
+        fetch = getattr(spec, "fetch", None)
 
-            if not _fetch_is_days_only(fetch):
-                print(f"[ingest] skipping template connector {name} (requires args)")
-                continue
+        if not callable(fetch):
+            print(f"[ingest] skipping template connector {name} (no fetch)")
+            continue
 
-            print(f"[ingest] ({i}/{len(list(connectors)) if hasattr(connectors,'__len__') else '?'}) {name} — {src} (tier {tier}, {sig})")
+        if not _fetch_is_days_only(spec):
+            print(f"[ingest] skipping template connector {name} (requires args)")
+            continue
 
+        runnable.append(spec)
+
+    # Fetch all connectors concurrently — each is one HTTP GET, so wall time
+    # drops from sum(latencies) to roughly max(latencies). The connector
+    # interface is a plain sync callable, so threads do the fan-out.
+    def _fetch_one(spec):
+        try:
+            return spec.fetch(days=days), None
+        except Exception as e:
+            return None, e
+
+    # Overall deadline so one hung connector (e.g. a stalled CDN) can't
+    # stall the whole run; httpx timeouts usually fire first
+    fetch_deadline_s = 120.0
+
+    results: List[tuple] = [None] * len(runnable)
+    if runnable:
+        # no `with`: shutting the pool down without waiting lets the run
+        # proceed past a connector that blew the deadline
+        pool = ThreadPoolExecutor(max_workers=min(8, len(runnable)))
+        futures = {pool.submit(_fetch_one, spec): i for i, spec in enumerate(runnable)}
+        try:
+            for fut in as_completed(futures, timeout=fetch_deadline_s):
+                results[futures[fut]] = fut.result()
+        except FutureTimeoutError:
+            pass
+        for fut, i in futures.items():
+            if results[i] is None:
+                if fut.done():
+                    results[i] = fut.result()
+                else:
+                    results[i] = (None, TimeoutError(f"fetch exceeded {fetch_deadline_s:.0f}s deadline"))
+        pool.shutdown(wait=False, cancel_futures=True)
+
+    rows: List[dict] = []
+    # Feeds re-syndicate across sources, so connectors in the same run often
+    # yield the same event_uid; drop repeats here instead of shipping them to
+    # the DB just for ON CONFLICT to discard
+    seen_uids: set[str] = set()
+    for i, (spec, (items, err)) in enumerate(zip(runnable, results), start=1):
+        name = getattr(spec, "name", "unknown")
+        src = getattr(spec, "source_name", "unknown")
+        tier = getattr(spec, "source_tier", 3)
+        sig = getattr(spec, "signal_type", "research")
+
+        print(f"[ingest] ({i}/{len(runnable)}) {name} — {src} (tier {tier}, {sig})")
+
+        if err is not None:
+            print(f"[ingest] ⚠️  {name} failed: {err}")
+            continue
+
+        print(f"[ingest] {name}: fetched {len(items)} items")
+
+        for it in items:
             try:
-                items = fetch(days=days)
+                item = normalize_item(it, src, tier, sig)
             except Exception as e:
-                print(f"[ingest] ⚠️  {name} failed: {e}")
+                print(f"[ingest] normalize failed ({name}): {e}")
                 continue
 
-            print(f"[ingest] {name}: fetched {len(items)} items")
-
-            normalized: List[dict] = []
-            for it in items:
-                try:
-                    normalized.append(normalize_item(it, src, tier, sig))
-                except Exception as e:
-                    print(f"[ingest] normalize failed ({name}): {e}")
-
-            for item in normalized:
-                if not isinstance(item.get("date"), datetime):
-                    continue
-
-                # Store naive UTC in DB
-                d = item["date"]
-                if d.tzinfo is not None:
-                    d = d.astimezone(timezone.utc).replace(tzinfo=None)
-                item["date"] = d
-
-                with session.no_autoflush:
-                    exists = session.exec(select(Event).where(Event.event_uid == item["event_uid"])).first()
-                if exists:
-                    continue
+            if not isinstance(item.get("date"), datetime):
+                continue
 
-                session.add(Event(**item))
-                inserted += 1
+            # Store naive UTC in DB
+            d = item["date"]
+            if d.tzinfo is not None:
+                d = d.astimezone(timezone.utc).replace(tzinfo=None)
+            item["date"] = d
+            if item["event_uid"] in seen_uids:
+                continue
+            seen_uids.add(item["event_uid"])
+            rows.append(item)
 
+    # Dedup happens in the database: ON CONFLICT on the unique event_uid
+    # skips known rows, replacing the SELECT-per-item round-trips. One
+    # transaction for the whole run.
+    with get_session() as session:
+        for batch in _chunked(rows, _INSERT_BATCH):
+            stmt = upsert(Event).values(batch).on_conflict_do_nothing(
+                index_elements=["event_uid"]
+            )
+            result = session.exec(stmt)
+            inserted += result.rowcount
         session.commit()
 
     print(f"[ingest] done. total inserted={inserted}")
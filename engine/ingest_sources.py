@@ -1,12 +1,15 @@
 from __future__ import annotations
 
+import asyncio
+import heapq
+from collections import defaultdict
 from dataclasses import dataclass
 from datetime import datetime, timezone
-from typing import Dict, List, Tuple
+from typing import Dict, List
 
 from sqlmodel import select
 
-from connectors.rss import fetch_rss
+from connectors.rss import fetch_rss_many
 from database import get_session
 from engine.ingest import normalize_item
 from engine.sources import load_sources_config, flatten_enabled_sources
@@ -43,31 +46,46 @@ def ingest_from_sources_yaml(days: int = 365) -> Coverage:
     inserted_total = 0
     fetched_total = 0
 
-    by_channel_inserted: Dict[str, int] = {}
-    by_source_inserted: Dict[str, int] = {}
-    by_source_fetched: Dict[str, int] = {}
+    # defaultdict: ét hash-opslag per optælling i stedet for get()+sæt
+    by_channel_inserted: Dict[str, int] = defaultdict(int)
+    by_source_inserted: Dict[str, int] = defaultdict(int)
+    by_source_fetched: Dict[str, int] = defaultdict(int)
     errors: List[str] = []
 
-    with get_session() as session:
-        for i, (ch, src) in enumerate(pairs, start=1):
-            if src.type != "rss":
-                # html connectors kommer i senere step
-                continue
+    # html connectors kommer i senere step
+    rss_pairs = [(ch, src) for ch, src in pairs if src.type == "rss"]
+
+    # Hent alle feeds parallelt FØR DB-sessionen åbnes — feedene er ren
+    # netværks-I/O, så vægtiden bliver ~langsomste feed i stedet for summen.
+    # Én AsyncClient i ét asyncio.run erstatter trådpuljen: samme overlap,
+    # ingen tråde, og delte URLs hentes kun én gang
+    fetch_results: List[tuple] = []
+    if rss_pairs:
+        urls = list(dict.fromkeys(src.url for _, src in rss_pairs))
+        by_url = asyncio.run(fetch_rss_many(urls, days=days))
+        for _, src in rss_pairs:
+            res = by_url.get(src.url)
+            if isinstance(res, Exception):
+                fetch_results.append((None, res))
+            else:
+                fetch_results.append((res or [], None))
 
+    with get_session() as session:
+        to_insert: List[dict] = []
+        seen_uids: set = set()  # dedup på tværs af sources i samme run
+        for i, ((ch, src), (items, err)) in enumerate(zip(rss_pairs, fetch_results), start=1):
             signal_type = CHANNEL_TO_SIGNAL_TYPE.get(ch.key, ch.key)
 
             print(f"[ingest-yaml] ({i}) {ch.key} — {src.name} (tier {src.tier}, {signal_type})")
-            try:
-                items = fetch_rss(src.url, days=days)
-            except Exception as e:
-                msg = f"{ch.key}::{src.name} -> {type(e).__name__}: {e}"
+            if err is not None:
+                msg = f"{ch.key}::{src.name} -> {type(err).__name__}: {err}"
                 print(f"[ingest-yaml] ⚠️  {msg}")
                 errors.append(msg)
                 continue
 
             fetched_total += len(items)
             source_key = f"{ch.key} :: {src.name}"
-            by_source_fetched[source_key] = by_source_fetched.get(source_key, 0) + len(items)
+            by_source_fetched[source_key] += len(items)
 
             normalized: List[dict] = []
             for it in items:
@@ -80,6 +98,7 @@ def ingest_from_sources_yaml(days: int = 365) -> Coverage:
 
             inserted_this_source = 0
 
+            valid: List[dict] = []
             for item in normalized:
                 if not isinstance(item.get("date"), datetime):
                     continue
@@ -89,19 +108,33 @@ def ingest_from_sources_yaml(days: int = 365) -> Coverage:
                 if d.tzinfo is not None:
                     d = d.astimezone(timezone.utc).replace(tzinfo=None)
                 item["date"] = d
-
-                with session.no_autoflush:
-                    exists = session.exec(select(Event).where(Event.event_uid == item["event_uid"])).first()
-                if exists:
+                valid.append(item)
+
+            # Dedup i én IN-query per source i stedet for ét SELECT per item
+            existing: set = set()
+            uids = [it["event_uid"] for it in valid]
+            for start in range(0, len(uids), 500):
+                chunk = uids[start : start + 500]
+                existing.update(
+                    session.exec(select(Event.event_uid).where(Event.event_uid.in_(chunk))).all()
+                )
+
+            for item in valid:
+                uid = item["event_uid"]
+                if uid in existing or uid in seen_uids:
                     continue
+                seen_uids.add(uid)
 
-                session.add(Event(**item))
+                to_insert.append(item)
                 inserted_this_source += 1
                 inserted_total += 1
 
-            by_channel_inserted[ch.key] = by_channel_inserted.get(ch.key, 0) + inserted_this_source
-            by_source_inserted[source_key] = by_source_inserted.get(source_key, 0) + inserted_this_source
+            by_channel_inserted[ch.key] += inserted_this_source
+            by_source_inserted[source_key] += inserted_this_source
 
+        # Ét bulk-insert af dicts i stedet for unit-of-work flush pr. række
+        for start in range(0, len(to_insert), 1000):
+            session.bulk_insert_mappings(Event, to_insert[start : start + 1000])
         session.commit()
 
     print(f"[ingest-yaml] done. fetched={fetched_total}, inserted={inserted_total}")
@@ -109,9 +142,9 @@ def ingest_from_sources_yaml(days: int = 365) -> Coverage:
     return Coverage(
         inserted_total=inserted_total,
         fetched_total=fetched_total,
-        by_channel_inserted=by_channel_inserted,
-        by_source_inserted=by_source_inserted,
-        by_source_fetched=by_source_fetched,
+        by_channel_inserted=dict(by_channel_inserted),
+        by_source_inserted=dict(by_source_inserted),
+        by_source_fetched=dict(by_source_fetched),
         errors=errors,
     )
 
@@ -122,7 +155,8 @@ def print_coverage(cov: Coverage, top_n: int = 20) -> None:
         print(f"- {ch}: {n}")
 
     print("\nTop sources (inserted):")
-    for k, n in sorted(cov.by_source_inserted.items(), key=lambda x: x[1], reverse=True)[:top_n]:
+    # top-k i O(N log k) i stedet for fuld sortering af alle sources
+    for k, n in heapq.nlargest(top_n, cov.by_source_inserted.items(), key=lambda x: x[1]):
         fetched = cov.by_source_fetched.get(k, 0)
         print(f"  {n:>4} inserted / {fetched:>4} fetched  —  {k}")
 
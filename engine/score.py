@@ -1,8 +1,28 @@
 from __future__ import annotations
 
+from collections import Counter
 from datetime import datetime, timedelta
 from typing import Any, Dict, List, Tuple
 
+import numpy as np
+
+# signal_type -> component bucket; anything unknown counts as cross_adoption
+SIGNAL_TO_BUCKET = {
+    "research": "research_momentum",
+    "research_standards": "research_momentum",
+    "capital": "capital_momentum",
+    "capital_flows_markets": "capital_momentum",
+    "markets": "capital_momentum",
+    "regulatory": "reg_momentum",
+    "regulatory_policy": "reg_momentum",
+    "policy": "reg_momentum",
+    "infra": "infra_deploy",
+    "technology": "infra_deploy",
+    "technology_ai_infra": "infra_deploy",
+    "cyber": "infra_deploy",
+    "cyber_fraud_resilience": "infra_deploy",
+}
+
 
 def _as_dt(v) -> datetime | None:
     if isinstance(v, datetime):
@@ -22,54 +42,52 @@ def compute_component_scores(events: List[Dict[str, Any]]) -> Dict[str, float]:
     """
     n = len(events) or 1
 
-    # normalize signal_type buckets
-    buckets = {
-        "research_momentum": 0,
-        "capital_momentum": 0,
-        "reg_momentum": 0,
-        "infra_deploy": 0,
-        "cross_adoption": 0,
+    # normalize signal_type buckets: one dict lookup per event instead of
+    # walking an elif chain of membership tuples
+    counts = Counter(
+        SIGNAL_TO_BUCKET.get((e.get("signal_type") or "").lower(), "cross_adoption")
+        for e in events
+    )
+
+    # convert counts -> 0..100 (share-based)
+    return {
+        k: round(100.0 * (counts.get(k, 0) / n), 2)
+        for k in ("research_momentum", "capital_momentum", "reg_momentum", "infra_deploy", "cross_adoption")
     }
 
-    for e in events:
-        st = (e.get("signal_type") or "").lower()
-        if st in ("research", "research_standards"):
-            buckets["research_momentum"] += 1
-        elif st in ("capital", "capital_flows_markets", "markets"):
-            buckets["capital_momentum"] += 1
-        elif st in ("regulatory", "regulatory_policy", "policy"):
-            buckets["reg_momentum"] += 1
-        elif st in ("infra", "technology", "technology_ai_infra", "cyber", "cyber_fraud_resilience"):
-            buckets["infra_deploy"] += 1
-        else:
-            buckets["cross_adoption"] += 1
 
-    # convert counts -> 0..100 (share-based)
-    out: Dict[str, float] = {}
-    for k, c in buckets.items():
-        out[k] = round(100.0 * (c / n), 2)
+# Impact is weighted “so what” — tuned to prefer cross-signal + binding forces.
+IMPACT_WEIGHTS = {
+    "research_momentum": 0.20,
+    "capital_momentum": 0.25,
+    "reg_momentum": 0.25,
+    "infra_deploy": 0.20,
+    "cross_adoption": 0.10,
+}
 
-    return out
+_IMPACT_KEYS = tuple(IMPACT_WEIGHTS)
+_IMPACT_W = np.array([IMPACT_WEIGHTS[k] for k in _IMPACT_KEYS])
 
 
 def compute_impact(components: Dict[str, float]) -> float:
-    """
-    Impact is weighted “so what” — tuned to prefer cross-signal + binding forces.
-    """
-    w = {
-        "research_momentum": 0.20,
-        "capital_momentum": 0.25,
-        "reg_momentum": 0.25,
-        "infra_deploy": 0.20,
-        "cross_adoption": 0.10,
-    }
     score = 0.0
-    for k, weight in w.items():
+    for k, weight in IMPACT_WEIGHTS.items():
         score += weight * float(components.get(k, 0.0))
 
     return round(score, 2)
 
 
+def compute_impact_batch(components_list: List[Dict[str, float]]) -> np.ndarray:
+    """
+    Vectorized compute_impact: one (n, 5) @ (5,) matmul for all movements
+    instead of a scalar weighted sum per movement. Same rounding.
+    """
+    if not components_list:
+        return np.empty(0)
+    X = np.array([[float(c.get(k, 0.0)) for k in _IMPACT_KEYS] for c in components_list])
+    return np.round(X @ _IMPACT_W, 2)
+
+
 def compute_confidence(
     events: List[Dict[str, Any]],
     components: Dict[str, float],
@@ -114,31 +132,34 @@ def compute_confidence(
 def compute_acceleration(
     events: List[Dict[str, Any]],
     baseline90,  # BaselineCounts or (recent_90, baseline_90)
+    now: datetime | None = None,
 ) -> Tuple[float, str, Dict[str, Any]]:
     """
     Acceleration compares last-90-days vs prior-90-days baseline (90–180d ago).
+    Callers scoring many movements pass `now` once so the cutoff isn't
+    recomputed per movement.
     Returns:
       - accel_raw (0..100-ish)
       - arrow: "↑" "→" "↓"
       - meta with ratio + counts
     """
-    now = datetime.utcnow()
+    now = now or datetime.utcnow()
     cutoff_90 = now - timedelta(days=90)
 
-    recent_90 = 0
-    for e in events:
-        d = _as_dt(e.get("date"))
-        if not d:
-            continue
-        if d >= cutoff_90:
-            recent_90 += 1
-
-    # baseline90 can be BaselineCounts (iterable) or dict-like
-    baseline_90 = 0.0
-    try:
-        r, b = baseline90  # __iter__
-        baseline_90 = float(b)
-    except Exception:
+    # One vectorized comparison over a timestamp array replaces the
+    # per-event datetime comparison loop
+    cutoff_ts = cutoff_90.timestamp()
+    ts = np.fromiter(
+        (d.timestamp() for d in (_as_dt(e.get("date")) for e in events) if d is not None),
+        dtype=np.float64,
+    )
+    recent_90 = int((ts >= cutoff_ts).sum())
+
+    # baseline90 can be a (recent_90, baseline_90) pair or BaselineCounts-like;
+    # a type check beats try/except unpacking on this per-movement path
+    if isinstance(baseline90, (tuple, list)):
+        baseline_90 = float(baseline90[1])
+    else:
         baseline_90 = float(getattr(baseline90, "baseline_90", 0.0) or 0.0)
 
     ratio = (recent_90 + 1.0) / (baseline_90 + 1.0)
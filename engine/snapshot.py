@@ -1,62 +1,89 @@
-from datetime import datetime
+from datetime import datetime, timezone
 
 from sqlmodel import select
 
-from database import get_session
+from database import get_session, upsert
 from models import Movement, MovementSnapshot, TextSnapshot, ThemeSnapshot
 
 
+_MONTH_TO_Q = (1, 1, 1, 2, 2, 2, 3, 3, 3, 4, 4, 4)
+
+
 def quarter_id_for(dt: datetime) -> str:
-    q = (dt.month - 1) // 3 + 1
-    return f"{dt.year}Q{q}"
+    return f"{dt.year}Q{_MONTH_TO_Q[dt.month - 1]}"
 
 
 def create_snapshot(themes: list, executive_summary: str, discussion_topics: str) -> str:
-    qid = quarter_id_for(datetime.utcnow())
+    # naive UTC, same convention as the rest of the DB layer; utcnow() is
+    # deprecated from 3.12
+    qid = quarter_id_for(datetime.now(timezone.utc).replace(tzinfo=None))
     with get_session() as session:
-        # Upsert text snapshot
-        existing = session.exec(select(TextSnapshot).where(TextSnapshot.quarter_id == qid)).first()
-        if existing:
-            existing.executive_summary = executive_summary
-            existing.discussion_topics = discussion_topics
-        else:
-            session.add(
-                TextSnapshot(
-                    quarter_id=qid,
+        # Upsert text snapshot in one statement (quarter_id is unique)
+        # instead of SELECT-then-add
+        stmt = (
+            upsert(TextSnapshot)
+            .values(
+                quarter_id=qid,
+                executive_summary=executive_summary,
+                discussion_topics=discussion_topics,
+            )
+            .on_conflict_do_update(
+                index_elements=["quarter_id"],
+                set_=dict(
                     executive_summary=executive_summary,
                     discussion_topics=discussion_topics,
-                )
+                ),
             )
+        )
+        session.exec(stmt)
 
-        # Themes
-        for t in themes:
-            top_ids = ",".join(str(x) for x in t["top_movements"][:10])
-            session.add(
-                ThemeSnapshot(
-                    quarter_id=qid,
-                    theme=t["theme"],
-                    theme_score=t["theme_score"],
-                    confidence_label=t["confidence_label"],
-                    acceleration_arrow=t["acceleration_arrow"],
-                    top_movement_ids=top_ids,
-                )
-            )
+        # Themes — one bulk insert of dicts instead of a flush per row
+        theme_rows = [
+            {
+                "quarter_id": qid,
+                "theme": t["theme"],
+                "theme_score": t["theme_score"],
+                "confidence_label": t["confidence_label"],
+                "acceleration_arrow": t["acceleration_arrow"],
+                "top_movement_ids": list(t["top_movements"][:10]),
+            }
+            for t in themes
+        ]
+        if theme_rows:
+            session.bulk_insert_mappings(ThemeSnapshot, theme_rows)
 
-        # Movements snapshot from current movement table
-        movements = session.exec(select(Movement)).all()
-        for m in movements:
-            session.add(
-                MovementSnapshot(
-                    quarter_id=qid,
-                    movement_id=m.id,
-                    theme=m.theme,
-                    impact_score=m.impact_score,
-                    stabilized_impact=m.stabilized_impact,
-                    confidence_label=m.confidence_label,
-                    acceleration_arrow=m.acceleration_arrow,
-                    persistence=m.persistence,
-                )
+        # Movements snapshot from current movement table — stream a narrow
+        # projection (no ORM hydration, no audit_json blob) rather than
+        # materializing the whole movement history, flushing in chunks so
+        # memory stays flat as the table grows
+        movement_rows: list = []
+        snap_cols = select(
+            Movement.id,
+            Movement.theme,
+            Movement.impact_score,
+            Movement.stabilized_impact,
+            Movement.confidence_label,
+            Movement.acceleration_arrow,
+            Movement.persistence,
+        ).execution_options(yield_per=1000)
+        for m in session.exec(snap_cols):
+            movement_rows.append(
+                {
+                    "quarter_id": qid,
+                    "movement_id": m.id,
+                    "theme": m.theme,
+                    "impact_score": m.impact_score,
+                    "stabilized_impact": m.stabilized_impact,
+                    "confidence_label": m.confidence_label,
+                    "acceleration_arrow": m.acceleration_arrow,
+                    "persistence": m.persistence,
+                }
             )
+            if len(movement_rows) >= 1000:
+                session.bulk_insert_mappings(MovementSnapshot, movement_rows)
+                movement_rows = []
+        if movement_rows:
+            session.bulk_insert_mappings(MovementSnapshot, movement_rows)
 
         session.commit()
     return qid
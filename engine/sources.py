@@ -6,6 +6,13 @@ from typing import Any, Dict, List, Optional, Tuple
 
 import yaml
 
+try:
+    # libyaml parser — parses sources.yaml several times faster when the
+    # system library is available
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:
+    from yaml import SafeLoader as _YamlLoader
+
 
 # ---- Data model ----
 
@@ -51,7 +58,17 @@ def _as_tuple_str(x: Any) -> Tuple[str, ...]:
     return (str(x).strip(),)
 
 
-def _validate_source(raw: Dict[str, Any], channel_key: str) -> SourceSpec:
+_HTTP_SCHEMES = ("http://", "https://")
+
+
+def _validate_source(
+    raw: Dict[str, Any],
+    channel_key: str,
+    # bound as defaults so the per-source hot path reads locals, not globals
+    _allowed=ALLOWED_SOURCE_TYPES,
+    _tiers=ALLOWED_TIERS,
+    _schemes=_HTTP_SCHEMES,
+) -> SourceSpec:
     if not isinstance(raw, dict):
         raise SourcesConfigError(f"Source in channel '{channel_key}' must be a mapping/dict.")
 
@@ -65,14 +82,14 @@ def _validate_source(raw: Dict[str, Any], channel_key: str) -> SourceSpec:
 
     if not name:
         raise SourcesConfigError(f"Missing 'name' in source for channel '{channel_key}'.")
-    if stype not in ALLOWED_SOURCE_TYPES:
+    if stype not in _allowed:
         raise SourcesConfigError(
-            f"Invalid source type '{stype}' for '{name}' in '{channel_key}'. Allowed: {sorted(ALLOWED_SOURCE_TYPES)}"
+            f"Invalid source type '{stype}' for '{name}' in '{channel_key}'. Allowed: {sorted(_allowed)}"
         )
-    if not (url.startswith("http://") or url.startswith("https://")):
+    if not url.startswith(_schemes):
         raise SourcesConfigError(f"Invalid 'url' for '{name}' in '{channel_key}': must be http(s).")
-    if tier not in ALLOWED_TIERS:
-        raise SourcesConfigError(f"Invalid 'tier'={tier} for '{name}' in '{channel_key}'. Allowed: {sorted(ALLOWED_TIERS)}")
+    if tier not in _tiers:
+        raise SourcesConfigError(f"Invalid 'tier'={tier} for '{name}' in '{channel_key}'. Allowed: {sorted(_tiers)}")
 
     region_str = str(region).strip() if region is not None else None
     return SourceSpec(
@@ -86,12 +103,22 @@ def _validate_source(raw: Dict[str, Any], channel_key: str) -> SourceSpec:
     )
 
 
+# Parsed configs are immutable (frozen dataclasses, tuples), so one parse
+# can be shared until the file changes on disk; keyed on (path, mtime_ns)
+_CONFIG_CACHE: Dict[Tuple[str, int], SourcesConfig] = {}
+
+
 def load_sources_config(path: str | Path = "sources.yaml") -> SourcesConfig:
     p = Path(path)
     if not p.exists():
         raise SourcesConfigError(f"Sources config not found: {p.resolve()}")
 
-    data = yaml.safe_load(p.read_text(encoding="utf-8")) or {}
+    cache_key = (str(p.resolve()), p.stat().st_mtime_ns)
+    cached = _CONFIG_CACHE.get(cache_key)
+    if cached is not None:
+        return cached
+
+    data = yaml.load(p.read_text(encoding="utf-8"), Loader=_YamlLoader) or {}
     if not isinstance(data, dict):
         raise SourcesConfigError("Top-level YAML must be a mapping/dict.")
 
@@ -118,7 +145,9 @@ def load_sources_config(path: str | Path = "sources.yaml") -> SourcesConfig:
 
         channels.append(ChannelSpec(key=str(ch_key), title=title, sources=tuple(sources)))
 
-    return SourcesConfig(version=version, channels=tuple(channels))
+    cfg = SourcesConfig(version=version, channels=tuple(channels))
+    _CONFIG_CACHE[cache_key] = cfg
+    return cfg
 
 
 def flatten_enabled_sources(cfg: SourcesConfig) -> List[Tuple[ChannelSpec, SourceSpec]]:
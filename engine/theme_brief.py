@@ -2,18 +2,28 @@ from __future__ import annotations
 
 from dataclasses import dataclass
 from datetime import datetime, timedelta
+from functools import lru_cache
 from typing import Dict, List
 
+from sqlalchemy import or_
 from sqlmodel import select
 
 from database import get_session
 from models import Event
 
-from engine.frontier_themes import THEMES, compute_theme_watchlist
-from engine.frontier import SIGNAL_TO_CHANNEL
+from engine.frontier_themes import THEMES, _keyword_pattern, compute_theme_watchlist
+from engine.frontier import SIGNAL_TO_CHANNEL, _HAY, _like_contains
+from engine.snapshot import quarter_id_for
 
 
-@dataclass
+@lru_cache(maxsize=8)
+def _watchlist_cached(top_n: int, qid: str):
+    # Briefs are a quarterly artifact — repeat callers within the same
+    # quarter share one run of the scoring pipeline
+    return compute_theme_watchlist(top_n=top_n)
+
+
+@dataclass(slots=True)
 class ThemeBrief:
     theme: str
     score: float
@@ -28,27 +38,51 @@ class ThemeBrief:
 
 
 def _text(ev: Event) -> str:
-    return f"{ev.title or ''} {ev.summary or ''}".lower()
+    return ev.haystack_lc or f"{ev.title or ''} {ev.summary or ''}".lower()
 
 
 def _match(ev: Event, keywords: List[str]) -> bool:
-    t = _text(ev)
-    return any(k in t for k in keywords)
+    return _keyword_pattern(tuple(keywords)).search(_text(ev)) is not None
 
 
 def _channel(ev: Event) -> str:
     return SIGNAL_TO_CHANNEL.get((ev.signal_type or "").strip(), "unknown")
 
 
+def _load_recent_events(days: int) -> List[Event]:
+    cutoff = datetime.utcnow() - timedelta(days=days)
+    with get_session() as session:
+        return session.exec(
+            select(Event).where(Event.date >= cutoff).order_by(Event.date.desc())
+        ).all()
+
+
 def select_theme_events(theme: str, keywords: List[str], days: int = 90, limit: int = 5, per_source_cap: int = 2) -> List[Event]:
+    # Standalone path: push the keyword filter into SQL so only matching
+    # rows are hydrated. The brief builder goes through _select_from_loaded
+    # instead, sharing one window read across all themes.
     cutoff = datetime.utcnow() - timedelta(days=days)
+    conds = or_(*[_HAY.like(_like_contains(k), escape="\\") for k in keywords])
 
     with get_session() as session:
-        events = session.exec(select(Event).where(Event.date >= cutoff).order_by(Event.date.desc())).all()
+        matches = session.exec(
+            select(Event).where(Event.date >= cutoff, conds).order_by(Event.date.desc())
+        ).all()
+
+    return _pick_from_matches(matches, limit, per_source_cap)
+
 
-    matches = [ev for ev in events if _match(ev, keywords)]
+def _select_from_loaded(events: List[Event], texts: List[str], keywords: List[str], limit: int, per_source_cap: int) -> List[Event]:
+    pat = _keyword_pattern(tuple(keywords))
+    matches = [ev for ev, t in zip(events, texts) if pat.search(t) is not None]
+    return _pick_from_matches(matches, limit, per_source_cap)
 
+
+def _pick_from_matches(matches: List[Event], limit: int, per_source_cap: int) -> List[Event]:
     selected: List[Event] = []
+    # id() works for both persisted and not-yet-flushed events (ev.id may be
+    # None pre-flush); same trick as entity_brief._pick_balanced
+    selected_ids: set = set()
     used_sources: Dict[str, int] = {}
     used_channels: Dict[str, int] = {}
 
@@ -63,6 +97,7 @@ def select_theme_events(theme: str, keywords: List[str], days: int = 90, limit:
             continue
 
         selected.append(ev)
+        selected_ids.add(id(ev))
         used_sources[src] = used_sources.get(src, 0) + 1
         used_channels[ch] = used_channels.get(ch, 0) + 1
 
@@ -73,12 +108,13 @@ def select_theme_events(theme: str, keywords: List[str], days: int = 90, limit:
     for ev in matches:
         if len(selected) >= limit:
             break
-        if ev in selected:
+        if id(ev) in selected_ids:
             continue
         src = ev.source_name or "unknown"
         if used_sources.get(src, 0) >= per_source_cap:
             continue
         selected.append(ev)
+        selected_ids.add(id(ev))
         used_sources[src] = used_sources.get(src, 0) + 1
 
     return selected[:limit]
@@ -112,12 +148,17 @@ def _board_question(theme: str) -> str:
 
 
 def build_theme_briefs(top_n: int = 8, events_per_theme: int = 5) -> List[ThemeBrief]:
-    watch = compute_theme_watchlist(top_n=top_n)
+    watch = _watchlist_cached(top_n, quarter_id_for(datetime.utcnow()))
     briefs: List[ThemeBrief] = []
 
+    # One 90d window read and one text pass shared by every theme, instead
+    # of a fresh query + re-lowercase per theme in select_theme_events
+    events = _load_recent_events(90)
+    texts = [_text(ev) for ev in events]
+
     for it in watch:
         keywords = THEMES.get(it.theme, [])
-        evs = select_theme_events(it.theme, keywords, days=90, limit=events_per_theme, per_source_cap=2)
+        evs = _select_from_loaded(events, texts, keywords, limit=events_per_theme, per_source_cap=2)
         briefs.append(
             ThemeBrief(
                 theme=it.theme,
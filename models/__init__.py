@@ -1,3 +1,3 @@
 from .event import Event, EventSourceRef
 from .movement import Movement, MovementEventLink
-from .snapshot import MovementSnapshot, TextSnapshot, ThemeSnapshot
+from .snapshot import MovementSnapshot, TextSnapshot, ThemeAggregationCache, ThemeSnapshot
@@ -1,6 +1,7 @@
 from datetime import datetime
 from typing import List, Optional
 
+from sqlalchemy import Index
 from sqlmodel import Field, Relationship, SQLModel
 
 
@@ -13,6 +14,14 @@ class EventSourceRef(SQLModel, table=True):
 
 
 class Event(SQLModel, table=True):
+    # coverage/correlation scans filter a date window per channel; the
+    # (date, signal_type, source_tier) index covers the scoring aggregates
+    # so their window scans never touch the base rows
+    __table_args__ = (
+        Index("ix_event_signal_date", "signal_type", "date"),
+        Index("ix_event_date_sig_tier", "date", "signal_type", "source_tier"),
+    )
+
     id: Optional[int] = Field(default=None, primary_key=True)
     event_uid: str = Field(index=True, unique=True)  # stable id (hash)
     date: datetime = Field(index=True)
@@ -24,6 +33,10 @@ class Event(SQLModel, table=True):
     url: str
     raw_text: Optional[str] = None
 
+    # lower(title + ' ' + summary), materialized at ingest so match paths
+    # never rebuild it; None only on rows from before the column existed
+    haystack_lc: Optional[str] = None
+
     entities: Optional[str] = None  # comma-separated for v1
     theme_hint: Optional[str] = None  # one of themes (hint)
     embedding: Optional[str] = None  # store as JSON string (v1)
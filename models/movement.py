@@ -1,15 +1,33 @@
 from datetime import datetime
 from typing import List, Optional
 
+from sqlalchemy import JSON, Column, Index, text
 from sqlmodel import Field, Relationship, SQLModel
 
 
 class MovementEventLink(SQLModel, table=True):
+    # Composite PK (movement_id, event_id) doubles as the covering index for
+    # the movement_id-prefixed lookups in app.py / cli.py
     movement_id: Optional[int] = Field(default=None, foreign_key="movement.id", primary_key=True)
     event_id: Optional[int] = Field(default=None, foreign_key="event.id", primary_key=True)
 
 
 class Movement(SQLModel, table=True):
+    # Theme pages and theme aggregation read (theme ASC, impact DESC) —
+    # storing the impact key descending lets SQLite satisfy that ORDER BY
+    # with a forward index scan, and the trailing columns make the
+    # aggregation projection an index-only read (id rides along as rowid)
+    __table_args__ = (
+        Index(
+            "ix_movement_theme_impact",
+            "theme",
+            text("stabilized_impact DESC"),
+            "confidence_score",
+            "confidence_label",
+            "acceleration_arrow",
+        ),
+    )
+
     id: Optional[int] = Field(default=None, primary_key=True)
     movement_uid: str = Field(index=True, unique=True)  # stable id (hash of core)
     name: str
@@ -36,6 +54,7 @@ class Movement(SQLModel, table=True):
     persistence: float = 0.0
     impact_horizon: str = "3-5 years"
 
-    audit_json: str = "{}"  # store dict as JSON string in v1
+    # native JSON — the engine (de)serializes with orjson, callers see a dict
+    audit_json: dict = Field(default_factory=dict, sa_column=Column(JSON))
 
     events: List["Event"] = Relationship(back_populates=None, link_model=MovementEventLink)  # resolved manually
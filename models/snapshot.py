@@ -1,10 +1,14 @@
 from datetime import datetime
-from typing import Optional
+from typing import List, Optional
 
+from sqlalchemy import JSON, Column, Index
 from sqlmodel import Field, SQLModel
 
 
 class ThemeSnapshot(SQLModel, table=True):
+    # /history looks snapshots up by (theme, quarter)
+    __table_args__ = (Index("ix_theme_snapshot_q_theme", "quarter_id", "theme"),)
+
     id: Optional[int] = Field(default=None, primary_key=True)
     quarter_id: str = Field(index=True)  # e.g. 2026Q1
     theme: str = Field(index=True)
@@ -12,7 +16,8 @@ class ThemeSnapshot(SQLModel, table=True):
     confidence_label: str
     acceleration_arrow: str
     created_at: datetime = Field(default_factory=datetime.utcnow, index=True)
-    top_movement_ids: str  # comma-separated movement ids
+    # native JSON list — readers get ints back without string splitting
+    top_movement_ids: List[int] = Field(default_factory=list, sa_column=Column(JSON))
 
 
 class MovementSnapshot(SQLModel, table=True):
@@ -28,6 +33,14 @@ class MovementSnapshot(SQLModel, table=True):
     created_at: datetime = Field(default_factory=datetime.utcnow, index=True)
 
 
+class ThemeAggregationCache(SQLModel, table=True):
+    # content-addressed aggregate_themes results; key is
+    # "<quarter_id>:<digest of input rows>" (see engine/themes.py)
+    key: str = Field(primary_key=True)
+    result: List[dict] = Field(default_factory=list, sa_column=Column(JSON))
+    created_at: datetime = Field(default_factory=datetime.utcnow)
+
+
 class TextSnapshot(SQLModel, table=True):
     id: Optional[int] = Field(default=None, primary_key=True)
     quarter_id: str = Field(index=True, unique=True)